@@ -8,168 +8,266 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import httpx
+import lxml.html
 import time
-import json
+import orjson
 import re
 import os
 
+from chrome_setup import chrome_options, driver_path
+
+BASE_URL = "https://oshoworld.com/audio-series-home-english"
+LINK_SELECTOR = "a.line-clamp-2.text-sky-700"
+# Browsers used in parallel by the Selenium fallback
+LISTING_WORKERS = 5
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+# Compiled once; these run for every link on every page
+EPISODE_RANGE_PAT = re.compile(r'#?\s*(\d+)\s*-\s*(\d+)')
+URL_RANGE_PAT = re.compile(r'(\d+)-(\d+)')
+
+# [href, visible text] of every listing link, in one round-trip instead of
+# a get_attribute and a .text call per link
+LINK_DATA_JS = """
+return Array.from(document.querySelectorAll(arguments[0]), a => [a.href, a.innerText.trim()]);
+"""
+
 def extract_episode_range(text_content):
     """
     Extract episode range from text like '... # 1-17'
     """
-    match = re.search(r'#?\s*(\d+)\s*-\s*(\d+)', text_content)
+    match = EPISODE_RANGE_PAT.search(text_content)
     return (int(match.group(1)), int(match.group(2))) if match else (None, None)
 
-def scrape_discourse_list(driver, total_pages=10):
-    """Scrape discourse list from all pages"""
-    print("🚀 Collecting discourse URLs...")
-    
-    base_url = "https://oshoworld.com/audio-series-home-english"
-    driver.get(base_url)
-    time.sleep(3) # Wait for initial load
-    
+def make_discourse_entry(href, full_text):
+    """
+    Build a discourse dict from a listing link's href and its text,
+    e.g. "Agyat Ki Aur (अज्ञात की ओर) # 1-7"
+    """
+    # Construct full URL for consistent processing
+    if href.startswith('/'):
+        href = "https://oshoworld.com" + href
+
+    # 1. Extract range from the link text
+    start_ep, end_ep = extract_episode_range(full_text)
+
+    # 2. Clean the title by removing the episode range part
+    title = EPISODE_RANGE_PAT.sub('', full_text).strip()
+
+    # 3. Fallback: Try to get range from URL
+    if not start_ep:
+        url_match = URL_RANGE_PAT.search(href)
+        if url_match:
+            start_ep = int(url_match.group(1))
+            end_ep = int(url_match.group(2))
+
+    return {
+        'title': title,
+        'url': href,
+        'start_episode': start_ep, # Will be None if not found
+        'end_episode': end_ep   # Will be None if not found
+    }
+
+def parse_listing_page(html):
+    """Return (href, text) pairs for every discourse link on a listing page"""
+    tree = lxml.html.fromstring(html)
+    return [(a.get('href'), a.text_content().strip()) for a in tree.cssselect(LINK_SELECTOR)]
+
+async def fetch_listing_page(client, page_num):
+    """Fetch one listing page over plain HTTP and parse its discourse links"""
+    response = await client.get(f"{BASE_URL}?page={page_num}")
+    response.raise_for_status()
+    return parse_listing_page(response.text)
+
+async def scrape_async(total_pages=10):
+    """
+    Fetch all listing pages concurrently over HTTP (no browser).
+    The listing is server-rendered, so a plain GET returns the same
+    links Selenium would find after the page's JS runs.
+    """
+    print("🚀 Collecting discourse URLs over HTTP...")
+
+    limits = httpx.Limits(max_keepalive_connections=10)
+    async with httpx.AsyncClient(http2=True, limits=limits, headers=HEADERS,
+                                 timeout=20, follow_redirects=True) as client:
+        # Probe page 1 first: no links in its static HTML means the listing
+        # is JS-rendered, so don't bother fetching the other pages
+        try:
+            first_page = await fetch_listing_page(client, 1)
+        except httpx.HTTPError as e:
+            print(f"❌ Page 1 failed: {e}")
+            return []
+        if not first_page:
+            return []
+
+        rest = await asyncio.gather(
+            *(fetch_listing_page(client, n) for n in range(2, total_pages + 1)),
+            return_exceptions=True
+        )
+        pages = [first_page, *rest]
+
+    discourse_series = []
+    seen_urls = set()
+
+    for page_num, links in enumerate(pages, 1):
+        print(f"📄 Page {page_num}/{total_pages}...", end=" ", flush=True)
+
+        if isinstance(links, Exception):
+            print(f"❌ Error: {links}")
+            continue
+
+        page_found = 0
+        for href, full_text in links:
+            if not href or not full_text:
+                continue
+
+            discourse = make_discourse_entry(href, full_text)
+            if discourse['url'] in seen_urls:
+                continue
+
+            seen_urls.add(discourse['url'])
+            discourse_series.append(discourse)
+            page_found += 1
+
+        print(f"✅ {page_found} found")
+
+    return discourse_series
+
+def scrape_listing_page(driver, page_num):
+    """Loads one listing page in Chrome and returns its (href, text) pairs"""
+    # Go straight to the page instead of clicking through the pagination
+    driver.get(f"{BASE_URL}?page={page_num}")
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_all_elements_located((By.CSS_SELECTOR, LINK_SELECTOR))
+    )
+
+    # Text comes straight from each link, e.g., "Agyat Ki Aur (अज्ञात की ओर) # 1-7"
+    return [(href, text) for href, text in driver.execute_script(LINK_DATA_JS, LINK_SELECTOR)]
+
+def listing_worker(page_nums):
+    """
+    Runs in its own thread with its own Chrome: scrapes each page in page_nums.
+    Returns {page_num: [(href, text), ...] or the exception that page raised}.
+    """
+    try:
+        driver = make_driver()
+    except Exception as e:
+        # This browser's pages fail; the other workers' pages are still kept
+        return dict.fromkeys(page_nums, e)
+
+    pages = {}
+    try:
+        for page_num in page_nums:
+            try:
+                pages[page_num] = scrape_listing_page(driver, page_num)
+            except Exception as e:
+                pages[page_num] = e
+    finally:
+        driver.quit()
+    return pages
+
+def scrape_discourse_list(total_pages=10):
+    """Scrape discourse list from all pages (Selenium fallback for JS-rendered listings)"""
+    num_workers = min(LISTING_WORKERS, total_pages)
+    print(f"🚀 Collecting discourse URLs with {num_workers} browsers...")
+
+    # Pages are addressable by ?page=N, so several browsers can split them
+    chunks = [list(range(1, total_pages + 1))[i::num_workers] for i in range(num_workers)]
+    pages = {}
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for result in executor.map(listing_worker, chunks):
+            pages.update(result)
+
     discourse_series = []
     seen_urls = set()
     
     for page_num in range(1, total_pages + 1):
         print(f"📄 Page {page_num}/{total_pages}...", end=" ", flush=True)
         
-        try:
-            # --- CHANGED: Wait for the *correct* link based on your snippet ---
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.line-clamp-2.text-sky-700"))
-            )
-            time.sleep(0.5) 
-            
-            # --- CHANGED: Use the new, specific selector ---
-            links = driver.find_elements(By.CSS_SELECTOR, "a.line-clamp-2.text-sky-700")
-            page_found = 0
-            
-            for link in links:
-                try:
-                    href = link.get_attribute('href')
-                    # Get text directly from this link, e.g., "Agyat Ki Aur (अज्ञात की ओर) # 1-7"
-                    full_text = link.text.strip() 
-                    
-                    if not href or not full_text:
-                        continue
-                        
-                    # Construct full URL for consistent processing
-                    if href and href.startswith('/'):
-                        href = "https://oshoworld.com" + href
-                        
-                    if not href or href in seen_urls:
-                        continue
-                        
-                    seen_urls.add(href)
-                    
-                    # --- CHANGED: Logic is now simpler ---
-                    
-                    # 1. Extract range from the link text
-                    start_ep, end_ep = extract_episode_range(full_text)
-                    
-                    # 2. Clean the title by removing the episode range part
-                    title = re.sub(r'#?\s*\d+\s*-\s*\d+', '', full_text).strip()
-                    
-                    # 3. Fallback: Try to get range from URL
-                    if not start_ep:
-                        url_match = re.search(r'(\d+)-(\d+)', href)
-                        if url_match:
-                            start_ep = int(url_match.group(1))
-                            end_ep = int(url_match.group(2))
-                    
-                    discourse_series.append({
-                        'title': title,
-                        'url': href,
-                        'start_episode': start_ep, # Will be None if not found
-                        'end_episode': end_ep   # Will be None if not found
-                    })
-                    page_found += 1
-                
-                except Exception as e:
-                    print(f" [Skipping one link due to error: {e}] ")
-                    continue
-            
-            print(f"✅ {page_found} found")
-            
-            # Navigate to next page
-            if page_num < total_pages:
-                try:
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(0.8)
-                    
-                    next_page_btn = driver.find_element(By.XPATH, 
-                        f"//button[text()='{page_num + 1}'] | //a[text()='{page_num + 1}']")
-                    
-                    driver.execute_script("arguments[0].click();", next_page_btn)
-                    time.sleep(2.5) # Wait for page transition
-                
-                except Exception:
-                    print(f"\nCould not find 'Next Page' button. Stopping.")
-                    break # Stop if pagination fails
-        
-        except Exception as e:
-            print(f"❌ Error on page {page_num}: {e}")
+        links = pages.get(page_num)
+        if links is None:
+            print(f"❌ Error on page {page_num}: not scraped")
+            continue
+        if isinstance(links, Exception):
+            print(f"❌ Error on page {page_num}: {links}")
             continue
+
+        page_found = 0
+        for href, full_text in links:
+            if not href or not full_text:
+                continue
+
+            discourse = make_discourse_entry(href, full_text)
+            if discourse['url'] in seen_urls:
+                continue
+
+            seen_urls.add(discourse['url'])
+            discourse_series.append(discourse)
+            page_found += 1
+            
+        print(f"✅ {page_found} found")
     
     return discourse_series
 
+def make_driver():
+    """Create the headless Chrome used by the Selenium fallback"""
+    print("🔧 Setting up ChromeDriver...")
+
+    options = chrome_options(window_size='1920,1080')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--log-level=3')
+    options.page_load_strategy = 'eager'
+
+    service = Service(driver_path())
+    driver = webdriver.Chrome(service=service, options=options)
+    print("✅ ChromeDriver ready\n")
+    return driver
+
 def main():
     print("="*70)
     print("📚 STEP 1: COLLECT DISCOURSE LINKS")
     print("="*70 + "\n")
+
+    # Collect discourse URLs over plain HTTP first
+    discourse_series = asyncio.run(scrape_async(total_pages=10))
+
+    if not discourse_series:
+        # Listing came back empty: it must be JS-rendered, use the browser
+        print("\n⚠️  No links in static HTML. Falling back to Selenium...\n")
+        discourse_series = scrape_discourse_list(total_pages=10)
+
+    print(f"\n{'='*70}")
+    print(f"✅ COLLECTION COMPLETE")
+    print(f"{'='*70}")
+    print(f"📚 Total discourses found: {len(discourse_series)}")
     
-    print("🔧 Setting up ChromeDriver...")
+    # Save to JSON
+    with open('discourse_links.json', 'wb') as f:
+        f.write(orjson.dumps(discourse_series, option=orjson.OPT_INDENT_2))
     
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless=new')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-sh_usage')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--window-size=1920,1080')
-    options.add_argument('--log-level=3') 
+    print(f"💾 Saved to: discourse_links.json")
+    print(f"{'='*70}\n")
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    print("✅ ChromeDriver ready\n")
+    # Print sample
+    print("Sample discourses:")
+    for i, disc in enumerate(discourse_series[:3], 1):
+        print(f"  {i}. {disc['title']}")
+        print(f"     {disc['url']}")
+        print(f"     Episodes: {disc['start_episode']}-{disc['end_episode']}\n")
     
-    try:
-        # Collect discourse URLs
-        discourse_series = scrape_discourse_list(driver, total_pages=10)
-        
-        print(f"\n{'='*70}")
-        print(f"✅ COLLECTION COMPLETE")
-        print(f"{'='*70}")
-        print(f"📚 Total discourses found: {len(discourse_series)}")
-        
-        # Save to JSON
-        with open('discourse_links.json', 'w', encoding='utf-8') as f:
-            json.dump(discourse_series, f, ensure_ascii=False, indent=2)
-        
-        print(f"💾 Saved to: discourse_links.json")
-        print(f"{'='*70}\n")
-        
-        # Print sample
-        print("Sample discourses:")
-        for i, disc in enumerate(discourse_series[:3], 1):
-            print(f"  {i}. {disc['title']}")
-            print(f"     {disc['url']}")
-            print(f"     Episodes: {disc['start_episode']}-{disc['end_episode']}\n")
-        
-        sample_none = next((d for d in discourse_series if d['start_episode'] is None), None)
-        if sample_none:
-            print("---")
-            print("Sample discourse (range not found, will be handled by next script):")
-            print(f"  ?. {sample_none['title']}")
-            print(f"     {sample_none['url']}")
-            print(f"     Episodes: {sample_none['start_episode']}-{sample_none['end_episode']}\n")
-
-        print(f"  ... and {len(discourse_series) - 3} more\n")
-        print("✅ Ready for next step: Run script 2 to extract MP3 links")
-        
-    finally:
-        driver.quit()
+    sample_none = next((d for d in discourse_series if d['start_episode'] is None), None)
+    if sample_none:
+        print("---")
+        print("Sample discourse (range not found, will be handled by next script):")
+        print(f"  ?. {sample_none['title']}")
+        print(f"     {sample_none['url']}")
+        print(f"     Episodes: {sample_none['start_episode']}-{sample_none['end_episode']}\n")
+
+    print(f"  ... and {len(discourse_series) - 3} more\n")
+    print("✅ Ready for next step: Run script 2 to extract MP3 links")
 
 if __name__ == "__main__":
     start_time = time.time()
@@ -11,11 +11,35 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import httpx
 import time
-import json
+import orjson
 import re
 import os
+import shelve
+
+from chrome_setup import block_heavy_resources, chrome_options, driver_path
+
+# One Chrome per worker process; more than 8 just fights over bandwidth
+NUM_WORKERS = min(8, os.cpu_count() or 1)
+# Restart a worker's Chrome after this many pages to keep its memory in check
+MAX_USES_PER_DRIVER = 50
+
+# Plain-HTTP probe settings
+HTTP_CONCURRENCY = 32
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+# The download link is server-rendered: <a download="X 01.mp3" href="/wp-content/...01.mp3">
+DOWNLOAD_LINK_PAT = re.compile(r'<a\b[^>]*?\bdownload="[^"]*\.mp3"[^>]*>', re.IGNORECASE)
+HREF_PAT = re.compile(r'(?<![\w-])href="([^"]+)"')  # Not data-href=
+
+# Remembers each page's first MP3 plus its ETag/Last-Modified between runs
+PROBE_CACHE_FILE = 'probe_cache.db'
+
+# Splits an MP3 URL into (base_url_part)(number)(.mp3)
+MP3_PAT = re.compile(r'^(.*[_-])(\d+)(\.mp3)$')
 
 def load_discourse_links():
     """Loads the links from discourse_links.json"""
@@ -25,8 +49,8 @@ def load_discourse_links():
         print("Please run Script 1 first to generate this file.")
         return None
         
-    with open(input_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(input_file, 'rb') as f:
+        return orjson.loads(f.read())
 
 def scrape_first_mp3(driver, url):
     """
@@ -53,6 +77,128 @@ def scrape_first_mp3(driver, url):
         print(f" [Error finding MP3: {str(e)[:50]}] ", end="")
         return None
 
+def link_to_mp3(link_tag):
+    """Returns the absolute href of a matched <a download="...mp3"> tag, or None"""
+    href = HREF_PAT.search(link_tag)
+    if not href:
+        return None
+
+    href = href.group(1)
+    if href.startswith('/'):
+        href = "https://oshoworld.com" + href
+    return href
+
+def conditional_headers(cached):
+    """If-None-Match / If-Modified-Since headers for a cached probe result"""
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+async def probe_with_httpx(client, semaphore, url, cache=None):
+    """
+    Fetches a discourse page without a browser and returns its first MP3 link (or None).
+    The page is streamed and the connection released as soon as the link shows up,
+    which is roughly the first fifth of the HTML.
+    With a cache, unchanged pages are answered by a 304 and never re-downloaded.
+    """
+    cached = cache.get(url) if cache is not None else None
+
+    async with semaphore:
+        try:
+            async with client.stream('GET', url, headers=conditional_headers(cached)) as response:
+                if response.status_code == 304 and cached:
+                    return cached['mp3']
+
+                response.raise_for_status()
+                html = ''
+                async for chunk in response.aiter_text():
+                    # Re-scan a little of the previous text in case a tag was split
+                    scan_from = max(0, len(html) - 1024)
+                    html += chunk
+                    link = DOWNLOAD_LINK_PAT.search(html, scan_from)
+                    if link:
+                        first_mp3 = link_to_mp3(link.group(0))
+                        if cache is not None and first_mp3:
+                            cache[url] = {
+                                'mp3': first_mp3,
+                                'etag': response.headers.get('etag'),
+                                'last_modified': response.headers.get('last-modified'),
+                            }
+                        return first_mp3
+        except httpx.HTTPError as e:
+            print(f" [HTTP error for {url}: {str(e)[:50]}] ")
+    return None
+
+def make_client():
+    """
+    One pooled HTTP/2 client for all probes: connections are kept alive
+    between pages and connect errors are retried.
+    """
+    limits = httpx.Limits(max_connections=HTTP_CONCURRENCY, max_keepalive_connections=HTTP_CONCURRENCY)
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+    return httpx.AsyncClient(transport=transport, headers=HEADERS, timeout=20, follow_redirects=True)
+
+async def probe_all(urls):
+    """Probes every URL concurrently and returns {url: first_mp3_url or None}"""
+    semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+    with shelve.open(PROBE_CACHE_FILE) as cache:
+        async with make_client() as client:
+            found = await asyncio.gather(*(probe_with_httpx(client, semaphore, url, cache) for url in urls))
+    return dict(zip(urls, found))
+
+def make_driver():
+    """Creates a headless Chrome instance"""
+    options = chrome_options(window_size='1920,1080')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--log-level=3')
+    options.page_load_strategy = 'eager'
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.plugins': 2,
+    })
+
+    service = Service(driver_path())
+    driver = webdriver.Chrome(service=service, options=options)
+    # Stylesheets and fonts have no content setting; block them at the network layer
+    block_heavy_resources(driver)
+    return driver
+
+def worker(urls_chunk):
+    """
+    Runs in its own process: reuses one Chrome for the whole chunk
+    (recycled every MAX_USES_PER_DRIVER pages) to scrape each first MP3.
+    Returns a list of (url, first_mp3_url) pairs.
+    """
+    driver = make_driver()
+    results = []
+    try:
+        for uses, url in enumerate(urls_chunk):
+            if uses and uses % MAX_USES_PER_DRIVER == 0:
+                driver.quit()
+                driver = make_driver()
+            else:
+                driver.delete_all_cookies()
+            results.append((url, scrape_first_mp3(driver, url)))
+    finally:
+        driver.quit()
+    return results
+
+def scrape_first_mp3_parallel(urls):
+    """Splits the URLs across NUM_WORKERS Chrome processes and merges the results"""
+    num_workers = min(NUM_WORKERS, len(urls))
+    if num_workers == 0:
+        return {}
+
+    chunks = [urls[i::num_workers] for i in range(num_workers)]
+    first_mp3s = {}
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        for results in executor.map(worker, chunks):
+            first_mp3s.update(results)
+    return first_mp3s
+
 def generate_mp3_links(first_mp3_url, start_ep, end_ep):
     """
     Generates all MP3 links based on the first URL and the episode range.
@@ -73,7 +219,7 @@ def generate_mp3_links(first_mp3_url, start_ep, end_ep):
 
     # This regex finds the number part just before the .mp3 extension
     # It captures (base_url_part)(number)(.mp3)
-    match = re.search(r'^(.*[_-])(\d+)(\.mp3)$', first_mp3_url)
+    match = MP3_PAT.search(first_mp3_url)
     
     if not match:
         print(f" [Error: Could not parse URL pattern: {first_mp3_url}] ", end="")
@@ -86,14 +232,12 @@ def generate_mp3_links(first_mp3_url, start_ep, end_ep):
     # Detect padding (e.g., "01" has padding 2, "001" has padding 3)
     num_padding = len(number_str)
     
-    mp3_links = []
-    for ep in range(start_ep, end_ep + 1):
-        # Format the episode number with the correct padding
-        ep_str = str(ep).zfill(num_padding)
-        mp3_url = f"{base_pattern}{ep_str}{extension}"
-        mp3_links.append(mp3_url)
-    
-    return mp3_links
+    # One bound format for the whole series, e.g. ".../OSHO-Adhyatam_Upanishad_{:02}.mp3";
+    # braces in the URL itself are doubled so format() keeps them literal
+    base_pattern = base_pattern.replace('{', '{{').replace('}', '}}')
+    extension = extension.replace('{', '{{').replace('}', '}}')
+    link_fmt = f"{base_pattern}{{:0{num_padding}}}{extension}".format
+    return list(map(link_fmt, range(start_ep, end_ep + 1)))
 
 def main():
     print("="*70)
@@ -104,67 +248,67 @@ def main():
     if discourse_series is None:
         return
         
-    print(f"✅ Loaded {len(discourse_series)} discourses from 'discourse_links.json'\n")
+    # Drop repeated URLs (e.g. pagination overlap) before anything is fetched
+    loaded = len(discourse_series)
+    discourse_series = list({d['url']: d for d in discourse_series}.values())
+    print(f"✅ Loaded {loaded} discourses from 'discourse_links.json' ({loaded - len(discourse_series)} duplicates dropped)\n")
     
-    print("🔧 Setting up ChromeDriver...")
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless=new')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-sh_usage')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--window-size=1920,1080')
-    options.add_argument('--log-level=3') 
+    # Only discourses with an episode range from Script 1 are worth a page load
+    urls = [d['url'] for d in discourse_series if d.get('start_episode') and d.get('end_episode')]
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    print("✅ ChromeDriver ready\n")
+    print(f"🌐 Probing {len(urls)} pages over HTTP...")
+    first_mp3s = asyncio.run(probe_all(urls))
+    missing = [url for url in urls if not first_mp3s.get(url)]
+    print(f"✅ {len(urls) - len(missing)} found in static HTML\n")
+    
+    # Cold path: only pages whose link wasn't in the raw HTML need a browser
+    if missing:
+        print(f"🔧 Scraping {len(missing)} pages with {min(NUM_WORKERS, len(missing))} Chrome workers...")
+        first_mp3s.update(scrape_first_mp3_parallel(missing))
+        print("✅ Pages scraped\n")
     
     all_data = []
     successful = 0
     failed = 0
     total_mp3s = 0
     
-    try:
-        for idx, discourse in enumerate(discourse_series, 1):
-            print(f"[{idx}/{len(discourse_series)}] {discourse['title'][:50]}...", end=" ", flush=True)
-            
-            # Check if we have the episode range from Script 1
-            start_ep = discourse.get('start_episode')
-            end_ep = discourse.get('end_episode')
-            
-            if not start_ep or not end_ep:
-                print("✗ Skipping (Missing episode range in JSON)")
-                failed += 1
-                continue
-            
-            # Scrape the first MP3 link from the page
-            first_mp3_url = scrape_first_mp3(driver, discourse['url'])
-            
-            if not first_mp3_url:
-                print("✗ Skipping (No MP3 link found on page)")
-                failed += 1
-                continue
-                
-            # Generate all links
-            all_mp3_links = generate_mp3_links(first_mp3_url, start_ep, end_ep)
-            
-            if not all_mp3_links:
-                print("✗ Skipping (Failed to generate links from pattern)")
-                failed += 1
-                continue
-                
-            all_data.append({
-                'discourse_name': discourse['title'],
-                'discourse_url': discourse['url'],
-                'mp3_links': all_mp3_links
-            })
+    for idx, discourse in enumerate(discourse_series, 1):
+        print(f"[{idx}/{len(discourse_series)}] {discourse['title'][:50]}...", end=" ", flush=True)
+        
+        # Check if we have the episode range from Script 1
+        start_ep = discourse.get('start_episode')
+        end_ep = discourse.get('end_episode')
+        
+        if not start_ep or not end_ep:
+            print("✗ Skipping (Missing episode range in JSON)")
+            failed += 1
+            continue
+        
+        # First MP3 link scraped from the page by the workers
+        first_mp3_url = first_mp3s.get(discourse['url'])
+        
+        if not first_mp3_url:
+            print("✗ Skipping (No MP3 link found on page)")
+            failed += 1
+            continue
             
-            print(f"✓ {len(all_mp3_links)} MP3s")
-            successful += 1
-            total_mp3s += len(all_mp3_links)
+        # Generate all links
+        all_mp3_links = generate_mp3_links(first_mp3_url, start_ep, end_ep)
+        
+        if not all_mp3_links:
+            print("✗ Skipping (Failed to generate links from pattern)")
+            failed += 1
+            continue
             
-    finally:
-        driver.quit()
+        all_data.append({
+            'discourse_name': discourse['title'],
+            'discourse_url': discourse['url'],
+            'mp3_links': all_mp3_links
+        })
+        
+        print(f"✓ {len(all_mp3_links)} MP3s")
+        successful += 1
+        total_mp3s += len(all_mp3_links)
 
     # --- Save final data ---
     print(f"\n{'='*70}")
@@ -177,8 +321,8 @@ def main():
     
     # Save to JSON
     output_file = 'osho_mp3_links.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(all_data, option=orjson.OPT_INDENT_2))
     
     print(f"💾 Saved to: {output_file}")
     print(f"{'='*70}\n")
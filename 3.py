@@ -1,32 +1,17 @@
 """
 Script 3: Create final formatted JSON with discourse names and MP3 links
 Input: discourse_with_mp3.json
-Output: osho_discourses_final.json
+Output: osho_discourses_final.json, osho_discourses_final.jsonl
 """
 
-import json
+import orjson
 import time
 
-def create_final_json():
-    print("="*70)
-    print("📦 STEP 3: CREATE FINAL JSON")
-    print("="*70 + "\n")
-    
-    # Load data from script 2
-    try:
-        with open('discourse_with_mp3.json', 'r', encoding='utf-8') as f:
-            discourse_data = json.load(f)
-        print(f"✅ Loaded {len(discourse_data)} discourses from discourse_with_mp3.json\n")
-    except FileNotFoundError:
-        print("❌ Error: discourse_with_mp3.json not found!")
-        print("   Please run script 2 first to extract MP3 links.\n")
-        return
-    
-    # Create final formatted structure
-    print("🔨 Creating final JSON structure...")
-    
+WRITE_BUFFER = 1 << 20
+
+def build_final_data(discourse_data):
+    """Turns script 2's per-discourse records into the final formatted list"""
     final_data = []
-    successful_count = 0
     
     for discourse in discourse_data:
         if discourse['status'] == 'success' and discourse['mp3_links']:
@@ -37,14 +22,34 @@ def create_final_json():
                 'total_episodes': discourse['end_episode'] - discourse['start_episode'] + 1,
                 'mp3_links': discourse['mp3_links']
             })
-            successful_count += 1
     
-    # Save final JSON
-    with open('osho_discourses_final.json', 'w', encoding='utf-8') as f:
-        json.dump(final_data, f, ensure_ascii=False, indent=2)
+    return final_data
+
+def write_final_files(json_path, ndjson_path, records):
+    """
+    Writes records, in one pass, both as an indented JSON array (matching
+    json.dump(..., indent=2)) and as NDJSON (one compact record per line),
+    without building either document in memory.
+    Returns the total number of MP3 links written.
+    """
+    total_mp3_files = 0
+    with open(json_path, 'wb', buffering=WRITE_BUFFER) as pretty, \
+         open(ndjson_path, 'wb', buffering=WRITE_BUFFER) as lines:
+        for i, record in enumerate(records):
+            pretty.write(b',\n' if i else b'[\n')
+            # Strings never contain raw newlines in JSON, so this only re-indents structure
+            pretty.write(b'  ' + orjson.dumps(record, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+            lines.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            total_mp3_files += len(record['mp3_links'])
+        pretty.write(b'\n]' if records else b'[]')
+    return total_mp3_files
+
+def save_final_json(final_data):
+    """Writes osho_discourses_final.json and final_stats.json and prints a summary"""
+    successful_count = len(final_data)
     
-    # Calculate statistics
-    total_mp3_files = sum(len(d['mp3_links']) for d in final_data)
+    # Save final JSON, one record at a time, counting MP3s on the way
+    total_mp3_files = write_final_files('osho_discourses_final.json', 'osho_discourses_final.jsonl', final_data)
     
     final_stats = {
         'total_discourses_with_mp3': successful_count,
@@ -59,15 +64,15 @@ def create_final_json():
         }
     }
     
-    with open('final_stats.json', 'w', encoding='utf-8') as f:
-        json.dump(final_stats, f, indent=2)
+    with open('final_stats.json', 'wb') as f:
+        f.write(orjson.dumps(final_stats, option=orjson.OPT_INDENT_2))
     
     print(f"{'='*70}")
     print("🎉 FINAL JSON CREATED!")
     print(f"{'='*70}")
     print(f"📚 Total discourses with MP3: {successful_count}")
     print(f"🎵 Total MP3 files: {total_mp3_files}")
-    print(f"\n📁 Output: osho_discourses_final.json")
+    print(f"\n📁 Output: osho_discourses_final.json (+ .jsonl)")
     print(f"📊 Stats: final_stats.json")
     print(f"{'='*70}\n")
     
@@ -75,12 +80,32 @@ def create_final_json():
     print("Sample data structure:")
     if final_data:
         sample = final_data[0]
-        print(json.dumps(sample, ensure_ascii=False, indent=2))
+        print(orjson.dumps(sample, option=orjson.OPT_INDENT_2).decode())
         print(f"\n... and {len(final_data) - 1} more discourses\n")
     
     print("✅ All done! You can now use osho_discourses_final.json")
     print(f"{'='*70}")
 
+def create_final_json():
+    print("="*70)
+    print("📦 STEP 3: CREATE FINAL JSON")
+    print("="*70 + "\n")
+    
+    # Load data from script 2
+    try:
+        with open('discourse_with_mp3.json', 'rb') as f:
+            discourse_data = orjson.loads(f.read())
+        print(f"✅ Loaded {len(discourse_data)} discourses from discourse_with_mp3.json\n")
+    except FileNotFoundError:
+        print("❌ Error: discourse_with_mp3.json not found!")
+        print("   Please run script 2 first to extract MP3 links.\n")
+        return
+    
+    # Create final formatted structure
+    print("🔨 Creating final JSON structure...")
+    final_data = build_final_data(discourse_data)
+    save_final_json(final_data)
+
 def main():
     start_time = time.time()
     create_final_json()
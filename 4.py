@@ -1,29 +1,46 @@
-import json
+import asyncio
+import collections
 import os
 import re
-import requests
 import signal
 import sys
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import aiofiles
+import httpx
+import orjson
 
 # --- Configuration ---
-STATE_FILE = "download_state.json"
+STATE_FILE = "download_state.jsonl"  # Append-only: one JSON-encoded URL per line
+LEGACY_STATE_FILE = "download_state.json"
 DOWNLOAD_BASE_DIR = "Downloads"
-MAX_THREADS = 16  # Max number of simultaneous downloads
+MAX_CONCURRENT = 16  # Max number of simultaneous downloads
+CHUNK_SIZE = 1 << 18  # 256 KiB per read/write
+WRITE_BUFFER = 1 << 20  # 1 MiB file buffer
 # ---------------------
 
+SANITIZE_PAT = re.compile(r'[\\/*?:"<>|]')
+
 class DownloadManager:
     def __init__(self):
         self.state_file = STATE_FILE
         self.base_dir = DOWNLOAD_BASE_DIR
         self.downloaded_urls = self.load_state()
-        self.exit_event = threading.Event()
-        self.lock = threading.Lock()
+        self.state_fp = open(self.state_file, 'ab')
+        self.exit_event = asyncio.Event()
+        self.lock = asyncio.Lock()
         
         # Set up signal handler for Ctrl+C
         signal.signal(signal.SIGINT, self.signal_handler)
 
+    def make_client(self):
+        """
+        Creates one pooled HTTP/2 client shared by all downloads,
+        so every file after the first reuses a kept-alive connection.
+        """
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=MAX_CONCURRENT)
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+        return httpx.AsyncClient(transport=transport, timeout=30, follow_redirects=True)
+
     def signal_handler(self, sig, frame):
         """Handle Ctrl+C gracefully."""
         print("\n\n🛑 Ctrl+C detected! Shutting down gracefully...")
@@ -31,34 +48,59 @@ class DownloadManager:
         self.exit_event.set()
 
     def load_state(self):
-        """Loads the set of already downloaded URLs from the state file."""
-        if os.path.exists(self.state_file):
+        """
+        Loads the set of already downloaded URLs from the journal
+        (plus the old full-JSON state file, if present), then compacts it
+        and retires the old file.
+        """
+        urls = set()
+        if os.path.exists(LEGACY_STATE_FILE):
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return set(json.load(f))
-            except json.JSONDecodeError:
-                print(f"Warning: '{self.state_file}' is corrupt. Starting fresh.")
-                return set()
-        return set()
-
-    def save_state(self):
-        """Saves the set of downloaded URLs to the state file."""
-        print("\n💾 Saving download state...")
-        try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.downloaded_urls), f, indent=2)
-            print(f"State saved. {len(self.downloaded_urls)} total files downloaded.")
-        except Exception as e:
-            print(f"❌ Error saving state: {e}")
+                with open(LEGACY_STATE_FILE, 'rb') as f:
+                    urls.update(orjson.loads(f.read()))
+            except orjson.JSONDecodeError:
+                print(f"Warning: '{LEGACY_STATE_FILE}' is corrupt. Ignoring it.")
+
+        if os.path.exists(self.state_file):
+            with open(self.state_file, 'rb') as f:
+                for line in f:
+                    try:
+                        urls.add(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        continue  # e.g. a line cut short by a crash
+
+        self.compact_state(urls)
+        # Its URLs are in the journal now, so don't merge it again next run
+        if os.path.exists(LEGACY_STATE_FILE):
+            os.replace(LEGACY_STATE_FILE, LEGACY_STATE_FILE + '.migrated')
+        return urls
+
+    def compact_state(self, urls):
+        """Rewrites the journal with exactly one line per URL."""
+        tmp_path = self.state_file + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.writelines(orjson.dumps(url) + b'\n' for url in urls)
+        os.replace(tmp_path, self.state_file)
+
+    def record_download(self, url):
+        """Appends one finished URL to the journal and forces it to disk."""
+        self.state_fp.write(orjson.dumps(url) + b'\n')
+        self.state_fp.flush()
+        os.fsync(self.state_fp.fileno())
+
+    def close_state(self):
+        """Closes the journal. Every download was recorded as it finished."""
+        self.state_fp.close()
+        print(f"\n💾 State saved. {len(self.downloaded_urls)} total files downloaded.")
 
     def sanitize_filename(self, name):
         """Removes illegal characters from a path component."""
-        return re.sub(r'[\\/*?:"<>|]', "", name).strip()
+        return SANITIZE_PAT.sub("", name).strip()
 
     def flatten_download_list(self, language_name, discourse_list):
         """
         Converts the nested JSON list into a flat list of download "jobs".
-        Each job is a dict: {'url': '...', 'path': '...'}
+        Each job is a dict: {'url': '...', 'path': '...', 'filename': '...'}
         """
         flat_list = []
         for discourse in discourse_list:
@@ -69,66 +111,147 @@ class DownloadManager:
             for url in discourse['mp3_links']:
                 try:
                     # Get filename from URL (e.g., OSHO-Adhyatam_Upanishad_01.mp3)
-                    filename = url.split('/')[-1]
+                    filename = url.rsplit('/', 1)[-1]
                     save_path = os.path.join(save_dir, filename)
-                    flat_list.append({'url': url, 'path': save_path})
+                    flat_list.append({'url': url, 'path': save_path, 'filename': filename})
                 except Exception as e:
                     print(f"\nWarning: Skipping invalid URL entry: {e}")
         
         return flat_list
 
-    def download_file(self, job):
+    def scan_downloaded_files(self, root):
+        """Walks root once with os.scandir and returns the set of finished file paths."""
+        found = set()
+        if not os.path.isdir(root):
+            return found
+
+        dirs = [root]
+        while dirs:
+            with os.scandir(dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dirs.append(entry.path)
+                    elif not entry.name.endswith('.tmp'):
+                        found.add(entry.path)
+        return found
+
+    def sync_state_with_disk(self, language_name, jobs):
+        """
+        Makes the state match what's actually on disk: files that exist
+        count as downloaded, entries whose file was deleted don't.
+        """
+        on_disk = self.scan_downloaded_files(os.path.join(self.base_dir, language_name))
+        for job in jobs:
+            if job['path'] in on_disk:
+                self.downloaded_urls.add(job['url'])
+            else:
+                self.downloaded_urls.discard(job['url'])
+
+    async def download_file(self, client, semaphore, job):
         """
         Downloads a single file.
-        Returns (url, status_message)
+        Returns (job, status_message)
         """
         url = job['url']
         path = job['path']
         
         # 1. Check if we should exit
         if self.exit_event.is_set():
-            return (url, 'interrupted')
+            return (job, 'interrupted')
 
         # 2. Check if already downloaded (double-check)
         if url in self.downloaded_urls:
-            return (url, 'skipped')
+            return (job, 'skipped')
 
-        # 3. Create directory
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        
-        # 4. Download to a .tmp file for atomic save
+        # 3. Download to a .tmp file for atomic save; a leftover .tmp
+        #    from an interrupted run is resumed with a Range request
         tmp_path = path + '.tmp'
         
         try:
-            with requests.get(url, stream=True, timeout=30) as r:
-                r.raise_for_status()
-                with open(tmp_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        # Check for exit *during* download
-                        if self.exit_event.is_set():
-                            raise KeyboardInterrupt
-                        f.write(chunk)
+            async with semaphore:
+                # Ctrl+C may have arrived while we were queued
+                if self.exit_event.is_set():
+                    return (job, 'interrupted')
+
+                resume_from = os.path.getsize(tmp_path) if os.path.exists(tmp_path) else 0
+                headers = {'Range': f'bytes={resume_from}-'} if resume_from else None
+
+                async with client.stream('GET', url, headers=headers) as r:
+                    r.raise_for_status()
+                    # 206: server honoured the Range, append; 200: it sent the whole file, start over
+                    mode = 'ab' if r.status_code == 206 else 'wb'
+                    async with aiofiles.open(tmp_path, mode, buffering=WRITE_BUFFER) as f:
+                        async for chunk in r.aiter_bytes(CHUNK_SIZE):
+                            # Check for exit *during* download
+                            if self.exit_event.is_set():
+                                raise KeyboardInterrupt
+                            await f.write(chunk)
+
+                        # Archived files aren't re-read soon; don't let them evict useful page cache
+                        if hasattr(os, 'posix_fadvise'):
+                            await f.flush()
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
             
-            # 5. Download complete, rename .tmp to final name
-            os.rename(tmp_path, path)
+            # 4. Download complete, atomically move .tmp to final name
+            os.replace(tmp_path, path)
             
-            # 6. Add to state (thread-safe)
-            with self.lock:
+            # 5. Add to state
+            async with self.lock:
                 self.downloaded_urls.add(url)
+                self.record_download(url)
                 
-            return (url, 'success')
+            return (job, 'success')
 
         except KeyboardInterrupt:
-            # Caused by self.exit_event.set()
+            # Caused by self.exit_event.set(); keep the .tmp so the next run resumes it
+            return (job, 'interrupted')
+
+        except httpx.HTTPStatusError as e:
+            # 404, 416 (partial file no longer matches), etc: the .tmp is useless
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
-            return (url, 'interrupted')
+            return (job, f'failed: {str(e)[:50]}')
         
         except Exception as e:
-            # Handle download errors (404, timeout, etc.)
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-            return (url, f'failed: {str(e)[:50]}')
+            # Timeouts, dropped connections: keep what we have and resume next time
+            return (job, f'failed: {str(e)[:50]}')
+
+    async def download_all(self, jobs, num_workers):
+        """Downloads a batch of jobs concurrently on one event loop."""
+        semaphore = asyncio.Semaphore(num_workers)
+        loop = asyncio.get_running_loop()
+
+        # Route Ctrl+C through the loop where the platform allows it
+        # (Windows doesn't; the plain signal handler keeps working there)
+        try:
+            loop.add_signal_handler(signal.SIGINT, self.signal_handler, None, None)
+            loop_handles_sigint = True
+        except NotImplementedError:
+            loop_handles_sigint = False
+
+        # Create each discourse folder once per batch, not once per file
+        for save_dir in {os.path.dirname(job['path']) for job in jobs}:
+            os.makedirs(save_dir, exist_ok=True)
+
+        try:
+            async with self.make_client() as client:
+                tasks = [self.download_file(client, semaphore, job) for job in jobs]
+
+                for next_done in asyncio.as_completed(tasks):
+                    job, status = await next_done
+                    filename = job['filename']
+                    
+                    if status == 'success':
+                        print(f"  ✅ Downloaded: {filename}")
+                    elif status == 'failed':
+                        print(f"  ❌ Failed: {filename} ({status})")
+                    elif status == 'interrupted':
+                        print(f"  🛑 Interrupted: {filename}")
+                    # We don't print 'skipped' since they weren't in the pending list
+        finally:
+            if loop_handles_sigint:
+                loop.remove_signal_handler(signal.SIGINT)
+                signal.signal(signal.SIGINT, self.signal_handler)
 
     def run(self):
         """Main interactive loop."""
@@ -151,8 +274,8 @@ class DownloadManager:
 
             # 2. Load the main JSON file
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    discourses = json.load(f)
+                with open(json_file, 'rb') as f:
+                    discourses = orjson.loads(f.read())
             except FileNotFoundError:
                 print(f"❌ Error: '{json_file}' not found in this folder.")
                 print("Please run the previous scripts first.")
@@ -163,10 +286,11 @@ class DownloadManager:
             total_files = len(all_jobs)
             print(f"📚 Found {total_files} total MP3s for {lang_name}.")
             
+            # 4. Find pending jobs once; batches are taken off the front
+            self.sync_state_with_disk(lang_name, all_jobs)
+            pending_jobs = collections.deque(job for job in all_jobs if job['url'] not in self.downloaded_urls)
+            
             while not self.exit_event.is_set():
-                # 4. Find pending jobs
-                pending_jobs = [job for job in all_jobs if job['url'] not in self.downloaded_urls]
-                
                 if not pending_jobs:
                     print("\n🎉 All files have been downloaded! 🎉")
                     break
@@ -187,42 +311,32 @@ class DownloadManager:
                 if batch_size == 0:
                     break
                 
-                # 6. Get the batch and start the threaded download
-                batch_to_download = pending_jobs[:batch_size]
-                num_workers = min(batch_size, MAX_THREADS)
+                # 6. Get the batch and start the concurrent download
+                batch_to_download = [pending_jobs.popleft() for _ in range(min(batch_size, len(pending_jobs)))]
+                num_workers = min(batch_size, MAX_CONCURRENT)
                 
-                print(f"\n🚀 Starting download of {len(batch_to_download)} files with {num_workers} threads...")
+                print(f"\n🚀 Starting download of {len(batch_to_download)} files with {num_workers} connections...")
                 
-                with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                    futures = [executor.submit(self.download_file, job) for job in batch_to_download]
-                    
-                    for future in as_completed(futures):
-                        if self.exit_event.is_set():
-                            break
-                        
-                        url, status = future.result()
-                        filename = url.split('/')[-1]
-                        
-                        if status == 'success':
-                            print(f"  ✅ Downloaded: {filename}")
-                        elif status == 'failed':
-                            print(f"  ❌ Failed: {filename} ({status})")
-                        elif status == 'interrupted':
-                            print(f"  🛑 Interrupted: {filename}")
-                        # We don't print 'skipped' since they weren't in the pending list
+                asyncio.run(self.download_all(batch_to_download, num_workers))
+                
+                # Failed/interrupted files go back to the front, in their original order
+                unfinished = [job for job in batch_to_download if job['url'] not in self.downloaded_urls]
+                pending_jobs.extendleft(reversed(unfinished))
 
         finally:
             # This block runs on normal exit OR Ctrl+C
-            self.save_state()
+            self.close_state()
 
 # --- Main execution ---
 if __name__ == "__main__":
-    # Install requests if not present
+    # Install httpx/aiofiles/orjson if not present
     try:
-        import requests
+        import httpx
+        import aiofiles
+        import orjson
     except ImportError:
-        print("Requests library not found. Installing...")
-        os.system(f"{sys.executable} -m pip install requests")
+        print("httpx/aiofiles/orjson not found. Installing...")
+        os.system(f"{sys.executable} -m pip install \"httpx[http2]\" aiofiles orjson")
         print("Install complete. Please run the script again.")
         sys.exit()
 
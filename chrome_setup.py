@@ -0,0 +1,81 @@
+"""
+Shared ChromeDriver lookup, launch flags and page-weight trimming.
+
+Selenium 4.10+ resolves a chromedriver matching the installed Chrome by
+itself (Selenium Manager) and caches it under ~/.cache/selenium, so
+there's no webdriver_manager install() round-trip on each run.
+Set CHROMEDRIVER=/path/to/chromedriver to pin a local binary instead.
+"""
+
+import os
+
+from selenium import webdriver
+
+# Chrome features a scraping-only session never uses; dropping them cuts
+# per-process memory and startup time. (--single-process is deliberately
+# left out: it crashes under load.)
+SCRAPER_CHROME_FLAGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-infobars',
+    '--disable-popup-blocking',
+    '--disable-background-networking',
+    '--disable-features=Translate,BackForwardCache,AcceptCHFrame,AutofillServerCommunication',
+    '--disk-cache-size=1',
+    '--media-cache-size=1',
+    '--incognito',
+    '--no-zygote',
+]
+
+# Everything the scrapers read is in the HTML; these only cost bandwidth
+BLOCKED_URLS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*/_next/image*',
+    '*.css', '*.woff', '*.woff2', '*.ttf',
+    '*.mp4', '*.webm', '*.mp3',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+
+def driver_path():
+    """
+    Return the pinned chromedriver path, or None so that Service(None)
+    lets Selenium Manager find the driver.
+    """
+    path = os.environ.get('CHROMEDRIVER')
+    if path and os.path.exists(path):
+        return path
+    return None
+
+
+def chrome_options(headless=True, window_size='1200,900', images=False):
+    """ChromeOptions with the shared scraping flags; callers add their own extras"""
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless=new')
+    for flag in SCRAPER_CHROME_FLAGS:
+        options.add_argument(flag)
+    if not images:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+    # Kept for layout-dependent pages (lazy loading, responsive menus)
+    options.add_argument(f'--window-size={window_size}')
+    return options
+
+
+def page_html(driver):
+    """
+    The rendered document's HTML through CDP (DOM.getOuterHTML on the root
+    node) instead of WebDriver's page_source serialisation.
+    """
+    root = driver.execute_cdp_cmd('DOM.getDocument', {'depth': 0})['root']['nodeId']
+    return driver.execute_cdp_cmd('DOM.getOuterHTML', {'nodeId': root})['outerHTML']
+
+
+def block_heavy_resources(driver):
+    """
+    Abort image, stylesheet, font, media and analytics requests via CDP.
+    URLs (e.g. og:image, .mp3 hrefs) can still be read from the DOM.
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
@@ -3,6 +3,9 @@ import json
 from pathlib import Path
 import re
 
+BY_PAT = re.compile(r'-by-.*$')
+RANGE_PAT = re.compile(r'-\d+-\d+$')
+
 def generate_chapter_links():
     """
     Reads discourse information from *-names.json files, generates chapter links,
@@ -29,11 +32,14 @@ def generate_chapter_links():
             continue
 
         slug = series_url.rstrip('/').split('/')[-1]
-        prefix = re.sub(r'-by-.*$', '', slug)
-        prefix = re.sub(r'-\d+-\d+$', '', prefix) # remove chapter range
+        prefix = BY_PAT.sub('', slug)
+        prefix = RANGE_PAT.sub('', prefix) # remove chapter range
         base_url = '/'.join(series_url.split('/')[:-1])
 
-        chapter_links = [f"{base_url}/{prefix}-{i:02}" for i in range(start_ep, end_ep + 1)]
+        # Bound str.format over the fixed part of the URL (braces escaped); map() skips the per-item frame
+        url_prefix = (base_url + '/' + prefix).replace('{', '{{').replace('}', '}}')
+        link_fmt = (url_prefix + '-{:02}').format
+        chapter_links = list(map(link_fmt, range(start_ep, end_ep + 1)))
 
         output_data.append({
             "discourse_name": title,
@@ -0,0 +1,84 @@
+"""
+On-disk cache of loaded chapter pages.
+
+A page's source is stored gzipped as cache/<sha1(url)>.html.gz once it
+has loaded properly, so a re-run after a crash (or a re-parse after a
+selector change) reads it from disk instead of opening it in Chrome.
+"""
+
+import gzip
+import hashlib
+from pathlib import Path
+from urllib.parse import urljoin
+
+import soupsieve as sv
+
+HTML_CACHE_DIR = Path("cache")
+
+# CSS selectors for chapter_data_from_soup, compiled once rather than per page
+TITLE_SELECTORS = [sv.compile(sel) for sel in ('h1.entry-title', 'h1.post-title', 'h1.page-title', 'h1')]
+OG_TITLE = sv.compile('meta[property="og:title"]')
+MP3_ANCHORS = sv.compile('a[href$=".mp3"]')
+AUDIO_SOURCES = sv.compile('audio source[src], audio[src]')
+OG_IMAGE = sv.compile('meta[property="og:image"]')
+NEXT_IMAGE = sv.compile('img[src*="/_next/image?url="]')
+
+
+def cache_path(url):
+    return HTML_CACHE_DIR / (hashlib.sha1(url.encode('utf-8')).hexdigest() + ".html.gz")
+
+
+def cached_html(url):
+    """Return the cached page source for url, or None"""
+    path = cache_path(url)
+    if not path.exists():
+        return None
+    try:
+        return gzip.decompress(path.read_bytes()).decode('utf-8')
+    except (OSError, EOFError):
+        return None  # e.g. cut short by a crash; the page is fetched again
+
+
+def store_html(url, html):
+    """Write the page source to the cache (via a temp file, so it's never half-written)"""
+    HTML_CACHE_DIR.mkdir(exist_ok=True)
+    path = cache_path(url)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_bytes(gzip.compress(html.encode('utf-8')))
+    tmp_path.replace(path)
+
+
+def chapter_data_from_soup(soup, url):
+    """
+    Title (WP heading, og:title or <title>), MP3 anchors/<audio> sources
+    and image (og:image or first Next.js image) from parsed page source.
+    """
+    title = ''
+    for sel in TITLE_SELECTORS:
+        el = sel.select_one(soup)
+        title = el.get_text().strip() if el else ''
+        if title:
+            break
+    if not title:
+        og = OG_TITLE.select_one(soup)
+        if og:
+            title = (og.get('content') or '').strip()
+        elif soup.title:
+            title = soup.title.get_text().strip()
+
+    # dict keys: de-duplicated as they're found, in page order
+    mp3_links = dict.fromkeys(urljoin(url, a['href']) for a in MP3_ANCHORS.select(soup) if a['href'])
+    for s in AUDIO_SOURCES.select(soup):
+        if s['src'].endswith('.mp3'):
+            mp3_links[urljoin(url, s['src'])] = None
+
+    image_url = ''
+    og_image = OG_IMAGE.select_one(soup)
+    if og_image:
+        image_url = og_image.get('content') or ''
+    else:
+        img = NEXT_IMAGE.select_one(soup)
+        if img:
+            image_url = urljoin(url, img['src'])
+
+    return {'title': title, 'mp3_links': list(mp3_links), 'image_url': image_url}
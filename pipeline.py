@@ -0,0 +1,148 @@
+"""
+Pipeline: Steps 1-3 in a single process
+Collects discourse links, finds each series' first MP3, generates all
+MP3 links and writes the final JSON - without the intermediate JSON
+files or a browser start per step. Discourse pages are probed while
+later listing pages are still downloading.
+
+Output: osho_discourses_final.json (+ .jsonl), final_stats.json
+"""
+
+import asyncio
+import importlib
+import shelve
+import time
+
+# The step scripts are named 1.py / 2.py / 3.py, so import them by name
+step1 = importlib.import_module('1')
+step2 = importlib.import_module('2')
+step3 = importlib.import_module('3')
+
+TOTAL_PAGES = 10
+NUM_CONSUMERS = step2.HTTP_CONCURRENCY
+
+async def fetch_numbered_page(client, page_num):
+    """Fetches one listing page and returns (page_num, links)"""
+    return page_num, await step1.fetch_listing_page(client, page_num)
+
+async def produce(client, queue, total_pages):
+    """
+    Fetches all listing pages concurrently and queues each new discourse
+    as soon as its page arrives.
+    """
+    seen_urls = set()
+    pages = [fetch_numbered_page(client, n) for n in range(1, total_pages + 1)]
+
+    for next_page in asyncio.as_completed(pages):
+        try:
+            page_num, links = await next_page
+        except Exception as e:
+            print(f"❌ Listing page failed: {e}")
+            continue
+
+        page_found = 0
+        for idx, (href, full_text) in enumerate(links):
+            if not href or not full_text:
+                continue
+
+            discourse = step1.make_discourse_entry(href, full_text)
+            if discourse['url'] in seen_urls:
+                continue
+
+            seen_urls.add(discourse['url'])
+            discourse['_order'] = (page_num, idx)
+            await queue.put(discourse)
+            page_found += 1
+
+        print(f"📄 Page {page_num}/{total_pages}: ✅ {page_found} found")
+
+    return len(seen_urls)
+
+async def process_discourse(client, semaphore, cache, discourse):
+    """Probes one discourse page and returns a record in script 3's input format"""
+    record = dict(discourse, status='failed', mp3_links=[])
+    start_ep = discourse['start_episode']
+    end_ep = discourse['end_episode']
+
+    if not start_ep or not end_ep:
+        return record
+
+    first_mp3_url = await step2.probe_with_httpx(client, semaphore, discourse['url'], cache)
+    record['mp3_links'] = step2.generate_mp3_links(first_mp3_url, start_ep, end_ep)
+    if record['mp3_links']:
+        record['status'] = 'success'
+    return record
+
+async def consume(client, semaphore, cache, queue, records):
+    """Worker: takes discourses off the queue until cancelled"""
+    while True:
+        discourse = await queue.get()
+        try:
+            records.append(await process_discourse(client, semaphore, cache, discourse))
+        except Exception as e:
+            # One bad discourse shouldn't take the worker down with it
+            print(f"❌ {discourse['title'][:50]}: {e}")
+            records.append(dict(discourse, status='failed', mp3_links=[]))
+        finally:
+            queue.task_done()
+
+async def run(total_pages):
+    """Runs the listing producer and the MP3 consumers over one shared HTTP client"""
+    queue = asyncio.Queue()
+    records = []
+    semaphore = asyncio.Semaphore(NUM_CONSUMERS)
+
+    with shelve.open(step2.PROBE_CACHE_FILE) as cache:
+        async with step2.make_client() as client:
+            consumers = [asyncio.create_task(consume(client, semaphore, cache, queue, records))
+                         for _ in range(NUM_CONSUMERS)]
+
+            try:
+                total_found = await produce(client, queue, total_pages)
+                await queue.join()
+            finally:
+                for consumer in consumers:
+                    consumer.cancel()
+                await asyncio.gather(*consumers, return_exceptions=True)
+
+    print(f"\n📚 Total discourses found: {total_found}")
+
+    # Keep the listing order regardless of which page arrived first
+    records.sort(key=lambda r: r.pop('_order'))
+    return records
+
+def selenium_fallback(records):
+    """Re-scrapes, with Chrome, the pages whose MP3 link wasn't in the raw HTML"""
+    missing = [r for r in records
+               if r['status'] != 'success' and r['start_episode'] and r['end_episode']]
+    if not missing:
+        return
+
+    print(f"🔧 Scraping {len(missing)} pages with Chrome...")
+    first_mp3s = step2.scrape_first_mp3_parallel([r['url'] for r in missing])
+    for record in missing:
+        record['mp3_links'] = step2.generate_mp3_links(
+            first_mp3s.get(record['url']), record['start_episode'], record['end_episode'])
+        if record['mp3_links']:
+            record['status'] = 'success'
+
+def main():
+    print("="*70)
+    print("🔗 PIPELINE: COLLECT, EXTRACT AND FORMAT")
+    print("="*70 + "\n")
+
+    records = asyncio.run(run(TOTAL_PAGES))
+    selenium_fallback(records)
+
+    # Every successful record (and only those) makes it into the final data
+    final_data = step3.build_final_data(records)
+    print(f"👍 Successful: {len(final_data)}")
+    print(f"👎 Failed: {len(records) - len(final_data)}\n")
+
+    step3.save_final_json(final_data)
+
+if __name__ == "__main__":
+    start_time = time.time()
+    main()
+    elapsed = time.time() - start_time
+    print(f"⏱️  Completed in {elapsed:.1f} seconds")
@@ -3,46 +3,246 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-import json
+from selenium.common.exceptions import TimeoutException
+import asyncio
+import httpx
+import lxml.html
+import orjson
+import os
 import re
 
+from chrome_setup import block_heavy_resources, chrome_options, driver_path
+
+# OSHO_DEBUG=1 prints sample links and writes debug_all_links_page_N.json per page
+DEBUG = os.environ.get('OSHO_DEBUG') == '1'
+
+# Compiled once; these run for every link on every page
+# (also handed to LINK_DATA_JS as a JS RegExp, so keep it to syntax both share)
+NON_DISCOURSE_URL_PAT = re.compile(r'/(?:audio-series-home|search|category|tag|page/|wp-|feed)|oshoworld\.com/[#?]|\.(?:mp3|jpe?g|png|pdf)$')
+EPISODE_RANGE_PAT = re.compile(r'#?\s*(\d+)\s*-\s*(\d+)')
+FIRST_MP3_SUFFIX_PAT = re.compile(r'_0*1\.mp3$')
+TITLE_RANGE_PAT = re.compile(r'#?\s*(\d+)-(\d+)')
+TITLE_NOISE_PAT = re.compile(r'\s*View all\s*|\s*Play\s*&?\s*Download\s*|\s*\d+\s*Discourses.*', re.IGNORECASE)
+
+# A series card link; once these exist the listing has rendered
+LISTING_LINK_SELECTOR = "a.line-clamp-2.text-sky-700"
+LISTING_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, LISTING_LINK_SELECTOR))
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+HTTP_CONCURRENCY = 16  # Discourse pages fetched at once in step 2
+
+# The card around a link: nearest post/entry/card div, else one of the first 3 div ancestors
+CONTAINER_XPATH = ("./ancestor::div[contains(@class, 'post') or contains(@class, 'entry') "
+                   "or contains(@class, 'card') or position()<=3][1]")
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'strong', 'b')
+
+# Collects every oshoworld link with its card's text and heading in a single
+# execute_script call, instead of several WebDriver round-trips per link
+LINK_DATA_JS = """
+const CONTAINER_XPATH = arguments[0];
+const NON_DISCOURSE = new RegExp(arguments[1]);
+const out = [];
+// Links in the same card share a container; lay out its text only once.
+// Every anchor is kept even if its href repeats: a card's image link may
+// come before its title link, and only the caller knows which one parsed
+const cards = new Map();
+for (const a of document.getElementsByTagName('a')) {
+    const href = a.href;
+    if (!href || !href.includes('oshoworld.com')) continue;
+    // Rejected before the (costly) walk up to the card
+    if (NON_DISCOURSE.test(href)) continue;
+
+    const container = document.evaluate(CONTAINER_XPATH, a, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue || a;
+
+    let card = cards.get(container);
+    if (!card) {
+        let heading = null;
+        for (const tag of ['h1', 'h2', 'h3', 'h4', 'h5', 'strong', 'b']) {
+            const el = container.querySelector(tag);
+            const text = el ? el.innerText.trim() : '';
+            if (text.length > 5) { heading = text; break; }
+        }
+        card = {container_text: container.innerText, heading: heading};
+        cards.set(container, card);
+    }
+
+    out.push({href: href, text: a.innerText.trim(),
+              container_text: card.container_text, heading: card.heading});
+}
+return out;
+"""
+
+def parse_listing_links(html, page_url):
+    """
+    Same data as LINK_DATA_JS, but parsed with lxml from raw HTML:
+    a dict with href, text, container_text and heading per oshoworld link
+    that isn't excluded by NON_DISCOURSE_URL_PAT. Repeated hrefs are kept;
+    the caller marks an href seen once one of its anchors gives a series.
+    """
+    tree = lxml.html.fromstring(html)
+    tree.make_links_absolute(page_url)
+
+    links = []
+    cards = {}
+    for a in tree.iter('a'):
+        href = a.get('href')
+        if not href or 'oshoworld.com' not in href:
+            continue
+        if NON_DISCOURSE_URL_PAT.search(href):
+            continue
+
+        containers = a.xpath(CONTAINER_XPATH)
+        container = containers[0] if containers else a
+
+        card = cards.get(container)
+        if card is None:
+            heading = None
+            for tag in HEADING_TAGS:
+                el = container.find(f'.//{tag}')
+                text = el.text_content().strip() if el is not None else ''
+                if len(text) > 5:
+                    heading = text
+                    break
+            card = cards[container] = {'container_text': container.text_content(), 'heading': heading}
+
+        links.append({'href': href, 'text': a.text_content().strip(), **card})
+    return links
+
+def fetch_static_listing(base_url, total_pages):
+    """
+    Fetches every listing page over plain HTTP (keep-alive) and parses it with lxml.
+    Returns {page_num: links}, or None if page 1 has no series links in its
+    HTML - i.e. the listing is JS-rendered and needs the browser.
+    """
+    pages = {}
+    with httpx.Client(http2=True, headers=HEADERS, timeout=20, follow_redirects=True) as client:
+        for page_num in range(1, total_pages + 1):
+            url = base_url if page_num == 1 else f"{base_url}?page={page_num}"
+            try:
+                response = client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                if page_num == 1:
+                    print(f"⚠️  Static fetch failed: {e}")
+                    return None
+                print(f"⚠️  Page {page_num} fetch failed: {e}")
+                pages[page_num] = []
+                continue
+
+            if page_num == 1 and not lxml.html.fromstring(response.text).cssselect(LISTING_LINK_SELECTOR):
+                return None
+            pages[page_num] = parse_listing_links(response.text, url)
+    return pages
+
+async def fetch_first_mp3(client, semaphore, url):
+    """First .mp3 link in the page's raw HTML, or None if it isn't there (or the fetch failed)"""
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+
+    tree = lxml.html.fromstring(response.content)
+    tree.make_links_absolute(str(response.url))
+    hrefs = tree.xpath('//a[substring(@href, string-length(@href) - 3) = ".mp3"]/@href')
+    return hrefs[0] if hrefs else None
+
+async def fetch_first_mp3s(urls):
+    """Fetches all discourse pages concurrently over one keep-alive client; returns {url: first mp3 or None}"""
+    semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+    limits = httpx.Limits(max_connections=HTTP_CONCURRENCY, max_keepalive_connections=HTTP_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, limits=limits,
+                                 timeout=20, follow_redirects=True) as client:
+        found = await asyncio.gather(*(fetch_first_mp3(client, semaphore, url) for url in urls))
+    return dict(zip(urls, found))
+
+def wait_until(driver, condition, timeout):
+    """WebDriverWait that gives up quietly, for places that used a fixed sleep"""
+    try:
+        WebDriverWait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+def count_listing_links(driver):
+    """Number of series links currently on the page"""
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length", LISTING_LINK_SELECTOR)
+
+def first_listing_href(driver):
+    """href of the first series link on the page, or None while it's (re)rendering"""
+    try:
+        links = driver.find_elements(By.CSS_SELECTOR, LISTING_LINK_SELECTOR)
+        return links[0].get_attribute('href') if links else None
+    except Exception:
+        return None
+
+def ndjson_to_json(ndjson_path, json_path):
+    """Rewrites an NDJSON file as an indented JSON array, holding one record at a time"""
+    with open(ndjson_path, 'rb') as src, open(json_path, 'wb') as dst:
+        count = 0
+        for line in src:
+            dst.write(b',\n' if count else b'[\n')
+            record = orjson.dumps(orjson.loads(line), option=orjson.OPT_INDENT_2)
+            dst.write(b'  ' + record.replace(b'\n', b'\n  '))
+            count += 1
+        dst.write(b'\n]' if count else b'[]')
+    return count
+
 def extract_episode_range(title):
     """Extract episode range from title like '# 1-17'"""
-    match = re.search(r'#?\s*(\d+)-(\d+)', title)
+    match = TITLE_RANGE_PAT.search(title)
     if match:
         return int(match.group(1)), int(match.group(2))
     return None, None
 
+def captured_mp3_urls(driver):
+    """
+    .mp3 URLs the browser requested since the last call, from Chrome's
+    performance log - catches players that load the file from a script or
+    JSON blob rather than an <a>. Reading the log also clears it.
+    """
+    urls = []
+    for entry in driver.get_log('performance'):
+        message = orjson.loads(entry['message'])['message']
+        if message['method'] == 'Network.requestWillBeSent':
+            url = message['params']['request']['url']
+            if url.endswith('.mp3'):
+                urls.append(url)
+    return urls
+
 def generate_mp3_links_from_first(first_mp3_url, start_ep, end_ep):
     """Generate all MP3 links based on the first episode URL"""
     if not first_mp3_url:
         return []
     
-    base_pattern = re.sub(r'_0*1\.mp3$', '', first_mp3_url)
-    
-    mp3_links = []
-    for ep in range(start_ep, end_ep + 1):
-        ep_str = str(ep).zfill(2)
-        mp3_url = f"{base_pattern}_{ep_str}.mp3"
-        mp3_links.append(mp3_url)
+    base_pattern = FIRST_MP3_SUFFIX_PAT.sub('', first_mp3_url)
     
-    return mp3_links
+    # Braces in the URL are doubled so format() keeps them literal
+    link_fmt = (base_pattern.replace('{', '{{').replace('}', '}}') + '_{:02}.mp3').format
+    return list(map(link_fmt, range(start_ep, end_ep + 1)))
 
-def scrape_osho_mp3_links():
-    """Scrape OSHO discourse MP3 links - DEBUG VERSION"""
-    
-    options = webdriver.ChromeOptions()
+def start_driver():
+    """Launch the visible debug Chrome, with network logging for captured_mp3_urls"""
     # Run visible to debug
-    # options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--window-size=1920,1080')
+    options = chrome_options(headless=False, window_size='1920,1080')
     options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    # get() returns at DOMContentLoaded; the MP3 anchors are in the initial HTML
+    options.page_load_strategy = 'eager'
+    # Network events only, for captured_mp3_urls
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(driver_path())
     driver = webdriver.Chrome(service=service, options=options)
+    block_heavy_resources(driver)
+    return driver
+
+def scrape_osho_mp3_links():
+    """Scrape OSHO discourse MP3 links - DEBUG VERSION"""
+    
+    # Started only if some page has to be rendered
+    driver = None
     
     try:
         print("="*80)
@@ -50,14 +250,31 @@ def scrape_osho_mp3_links():
         print("="*80)
         
         base_url = "https://oshoworld.com/audio-series-home-hindi"
-        driver.get(base_url)
+        total_pages = 10
         
-        print("\n⏳ Waiting for page to load...")
-        time.sleep(6)
+        # Server-rendered listings don't need the browser at all
+        print("\n🌐 Fetching listing pages over HTTP...")
+        static_pages = fetch_static_listing(base_url, total_pages)
+        if static_pages:
+            print("✅ Listing is in the static HTML; skipping the browser for discovery")
+        else:
+            print("⚠️  Listing is JS-rendered; using the browser")
+            driver = start_driver()
+            driver.get(base_url)
+            
+            print("\n⏳ Waiting for page to load...")
+            wait_until(driver, LISTING_PRESENT, 8)
         
         discourse_series = []
         seen_urls = set()
-        total_pages = 10
+        # A card's title and "View all" links point to different URLs but give the same title
+        seen_titles = set()
+        # Turned off after the first page if scrolling doesn't load any more links
+        scroll_enabled = True
+        
+        # Series are appended as they're found, so a crash keeps every finished page
+        collected_ndjson = 'collected_series_all.ndjson'
+        collected = open(collected_ndjson, 'wb')
         
         for page_num in range(1, total_pages + 1):
             print(f"\n{'='*80}")
@@ -66,188 +283,150 @@ def scrape_osho_mp3_links():
             
             try:
                 # Wait for content
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                time.sleep(3)
-                
-                # Scroll to trigger lazy loading
-                print("📜 Scrolling to load content...")
-                last_height = driver.execute_script("return document.body.scrollHeight")
-                for scroll_attempt in range(5):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)
-                    new_height = driver.execute_script("return document.body.scrollHeight")
-                    if new_height == last_height:
-                        break
-                    last_height = new_height
+                if not static_pages:
+                    wait_until(driver, LISTING_PRESENT, 15)
                 
-                driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
+                # Scroll to trigger lazy loading (numbered pagination usually makes this a no-op)
+                if scroll_enabled and not static_pages:
+                    print("📜 Scrolling to load content...")
+                    scrolls_loaded_links = False
+                    for scroll_attempt in range(5):
+                        links_before = count_listing_links(driver)
+                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                        # Stop as soon as the link count stops growing
+                        if not wait_until(driver, lambda d: count_listing_links(d) > links_before, 3):
+                            break
+                        scrolls_loaded_links = True
+                    
+                    if page_num == 1 and not scrolls_loaded_links:
+                        print("📜 No lazy loading detected; skipping scrolls from now on")
+                        scroll_enabled = False
                 
                 # DEBUG: Find ALL links and log them
                 print("\n🔍 DEBUG: Finding ALL links on page...")
-                all_page_links = driver.find_elements(By.TAG_NAME, "a")
+                if static_pages:
+                    all_page_links = static_pages[page_num]
+                else:
+                    # One round-trip: the browser returns every link with its container text and heading
+                    all_page_links = driver.execute_script(LINK_DATA_JS, CONTAINER_XPATH, NON_DISCOURSE_URL_PAT.pattern)
                 
                 discourse_candidates = []
                 for link in all_page_links:
-                    try:
-                        href = link.get_attribute('href')
-                        if href and 'oshoworld.com' in href:
-                            # Exclude non-discourse pages
-                            if any(x in href for x in ['/audio-series-home', '/search', '/category', 
-                                                        '/tag', '/page/', '/wp-', '/feed', 
-                                                        'oshoworld.com/#', 'oshoworld.com/?']):
-                                continue
-                            
-                            # Exclude homepage
-                            if href.rstrip('/') == 'https://oshoworld.com':
-                                continue
-                            
-                            discourse_candidates.append(link)
-                    except:
-                        pass
+                    href = link['href']
+                    # Exclude homepage (non-discourse pages and assets were dropped while collecting)
+                    if href.rstrip('/') == 'https://oshoworld.com':
+                        continue
+                    
+                    discourse_candidates.append(link)
                 
                 print(f"Found {len(discourse_candidates)} potential discourse links")
                 
                 # DEBUG: Print first 20 URLs to see patterns
-                print("\n📋 Sample URLs found:")
-                for i, link in enumerate(discourse_candidates[:20]):
-                    href = link.get_attribute('href')
-                    text = link.text.strip()[:50]
-                    print(f"  {i+1}. {href}")
-                    if text:
-                        print(f"      Text: {text}")
+                if DEBUG:
+                    print("\n📋 Sample URLs found:")
+                    for i, link in enumerate(discourse_candidates[:20]):
+                        text = link['text'][:50]
+                        print(f"  {i+1}. {link['href']}")
+                        if text:
+                            print(f"      Text: {text}")
                 
                 # Now process each link
                 print("\n🔍 Processing discourse links...")
                 
                 page_count = 0
-                page_discourses = []
                 
                 for link in discourse_candidates:
-                    try:
-                        href = link.get_attribute('href')
-                        
-                        # Skip if already seen
-                        if href in seen_urls:
-                            continue
-                        
-                        # Find parent container to get full context
-                        try:
-                            container = link.find_element(By.XPATH, "./ancestor::div[contains(@class, 'post') or contains(@class, 'entry') or contains(@class, 'card') or position()<=3][1]")
-                        except:
-                            try:
-                                container = link.find_element(By.XPATH, "./ancestor::div[2]")
-                            except:
-                                container = link
-                        
-                        container_text = container.text
-                        
-                        # Look for episode pattern
-                        episode_match = re.search(r'#?\s*(\d+)\s*-\s*(\d+)', container_text)
-                        if not episode_match:
-                            continue
-                        
-                        start_ep = int(episode_match.group(1))
-                        end_ep = int(episode_match.group(2))
-                        
-                        # Extract title
-                        title = None
-                        
-                        # Try to find heading in container
-                        for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'strong', 'b']:
-                            try:
-                                heading = container.find_element(By.TAG_NAME, tag)
-                                heading_text = heading.text.strip()
-                                if heading_text and len(heading_text) > 5:
-                                    title = heading_text
-                                    break
-                            except:
-                                pass
-                        
-                        # Fallback: use first line with episode pattern
-                        if not title:
-                            lines = container_text.split('\n')
-                            for line in lines:
-                                if re.search(r'#?\s*\d+\s*-\s*\d+', line) and len(line.strip()) > 5:
-                                    title = line.strip()
-                                    break
-                        
-                        # Last resort: use link text
-                        if not title:
-                            title = link.text.strip()
-                        
-                        # Clean title
-                        if title:
-                            title = re.sub(r'\s*View all\s*', '', title, flags=re.IGNORECASE)
-                            title = re.sub(r'\s*Play\s*&?\s*Download\s*', '', title, flags=re.IGNORECASE)
-                            title = re.sub(r'\s*\d+\s*Discourses.*', '', title, flags=re.IGNORECASE)
-                            title = title.strip()
-                        
-                        if not title or len(title) < 3:
-                            print(f"  ⚠️  Skipped (no title): {href[:60]}")
-                            continue
-                        
-                        # Valid discourse found!
-                        seen_urls.add(href)
-                        discourse_info = {
-                            'title': title,
-                            'url': href,
-                            'start_episode': start_ep,
-                            'end_episode': end_ep
-                        }
-                        discourse_series.append(discourse_info)
-                        page_discourses.append(discourse_info)
-                        page_count += 1
-                        
-                        print(f"  ✅ [{page_count}] {title[:70]}")
-                        print(f"      URL: {href}")
+                    href = link['href']
                     
-                    except Exception as e:
+                    # Skip if already seen
+                    if href in seen_urls:
                         continue
+                    
+                    container_text = link['container_text']
+                    
+                    # Look for episode pattern
+                    episode_match = EPISODE_RANGE_PAT.search(container_text)
+                    if not episode_match:
+                        continue
+                    
+                    start_ep = int(episode_match.group(1))
+                    end_ep = int(episode_match.group(2))
+                    
+                    # Extract title: heading found in the container by the script
+                    title = link['heading']
+                    
+                    # Fallback: use first line with episode pattern
+                    if not title:
+                        lines = container_text.split('\n')
+                        for line in lines:
+                            if EPISODE_RANGE_PAT.search(line) and len(line.strip()) > 5:
+                                title = line.strip()
+                                break
+                    
+                    # Last resort: use link text
+                    if not title:
+                        title = link['text']
+                    
+                    # Clean title
+                    if title:
+                        title = TITLE_NOISE_PAT.sub('', title).strip()
+                    
+                    if not title or len(title) < 3:
+                        print(f"  ⚠️  Skipped (no title): {href[:60]}")
+                        continue
+                    
+                    if title in seen_titles:
+                        continue
+                    
+                    # Valid discourse found!
+                    seen_urls.add(href)
+                    seen_titles.add(title)
+                    discourse_info = {
+                        'title': title,
+                        'url': href,
+                        'start_episode': start_ep,
+                        'end_episode': end_ep
+                    }
+                    discourse_series.append(discourse_info)
+                    collected.write(orjson.dumps(discourse_info, option=orjson.OPT_APPEND_NEWLINE))
+                    page_count += 1
+                    
+                    print(f"  ✅ [{page_count}] {title[:70]}")
+                    print(f"      URL: {href}")
                 
                 print(f"\n📊 Page {page_num} Summary: {page_count} discourses found")
                 print(f"📈 Total so far: {len(discourse_series)} discourses")
                 
                 # Save progress
-                with open(f'progress_page_{page_num}.json', 'w', encoding='utf-8') as f:
-                    json.dump(page_discourses, f, ensure_ascii=False, indent=2)
-                print(f"💾 Saved progress to: progress_page_{page_num}.json")
-                
-                # Save ALL links for debugging
-                debug_links = []
-                for link in discourse_candidates:
-                    try:
-                        debug_links.append({
-                            'href': link.get_attribute('href'),
-                            'text': link.text.strip()[:100]
-                        })
-                    except:
-                        pass
+                collected.flush()
+                print(f"💾 Saved progress to: {collected_ndjson}")
                 
-                with open(f'debug_all_links_page_{page_num}.json', 'w', encoding='utf-8') as f:
-                    json.dump(debug_links, f, ensure_ascii=False, indent=2)
-                print(f"🐛 Saved debug info to: debug_all_links_page_{page_num}.json")
+                # Save ALL links for debugging (from the same batched result, no extra WebDriver calls)
+                if DEBUG:
+                    debug_links = [{'href': link['href'], 'text': link['text'][:100]}
+                                   for link in discourse_candidates]
+                    
+                    with open(f'debug_all_links_page_{page_num}.json', 'wb') as f:
+                        f.write(orjson.dumps(debug_links, option=orjson.OPT_INDENT_2))
+                    print(f"🐛 Saved debug info to: debug_all_links_page_{page_num}.json")
                 
                 # Navigate to next page
-                if page_num < total_pages:
+                if page_num < total_pages and not static_pages:
                     print(f"\n➡️  Navigating to page {page_num + 1}...")
-                    time.sleep(2)
                     
+                    # Changes once the next page's listing has replaced this one
+                    old_first = first_listing_href(driver)
                     next_clicked = False
                     
                     # Method 1: Find pagination buttons
                     try:
                         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1)
                         
                         page_buttons = driver.find_elements(By.XPATH, 
                             f"//button[text()='{page_num + 1}'] | //a[text()='{page_num + 1}']")
                         
                         if page_buttons:
                             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", page_buttons[0])
-                            time.sleep(1)
                             driver.execute_script("arguments[0].click();", page_buttons[0])
                             next_clicked = True
                             print(f"  ✅ Clicked page {page_num + 1} button")
@@ -263,7 +442,6 @@ def scrape_osho_mp3_links():
                             
                             if next_buttons:
                                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_buttons[0])
-                                time.sleep(1)
                                 driver.execute_script("arguments[0].click();", next_buttons[0])
                                 next_clicked = True
                                 print("  ✅ Clicked Next button")
@@ -275,7 +453,7 @@ def scrape_osho_mp3_links():
                         print("  ⚠️  Using direct URL navigation")
                         driver.get(f"{base_url}?page={page_num + 1}")
                     
-                    time.sleep(4)
+                    wait_until(driver, lambda d: first_listing_href(d) not in (None, old_first), 8)
                     
             except Exception as e:
                 print(f"\n❌ Error on page {page_num}:")
@@ -290,49 +468,66 @@ def scrape_osho_mp3_links():
         print(f"📚 Total discourse series collected: {len(discourse_series)}")
         
         # Save all collected series
-        with open('collected_series_all.json', 'w', encoding='utf-8') as f:
-            json.dump(discourse_series, f, ensure_ascii=False, indent=2)
-        print(f"💾 Saved to: collected_series_all.json")
+        collected.close()
+        ndjson_to_json(collected_ndjson, 'collected_series_all.json')
+        print(f"💾 Saved to: collected_series_all.json (streamed from {collected_ndjson})")
         
         # STEP 2: Extract MP3 links
         print(f"\n{'='*80}")
         print("STEP 2: EXTRACTING MP3 LINKS")
         print(f"{'='*80}\n")
         
-        all_data = []
+        # Each result is appended to an NDJSON file as it's found, so nothing is
+        # lost on a crash and the MP3 lists never pile up in memory
+        ndjson_file = 'osho_mp3_links.ndjson'
+        out = open(ndjson_file, 'wb')
         successful = 0
         failed = 0
         failed_list = []
+        total_mp3_files = 0
+        
+        # All discourse pages at once over HTTP; Chrome only loads the ones
+        # whose MP3 link isn't in the raw HTML
+        print(f"🌐 Fetching {len(discourse_series)} discourse pages over HTTP...")
+        static_mp3s = asyncio.run(fetch_first_mp3s([d['url'] for d in discourse_series]))
+        print(f"✅ {sum(1 for url in static_mp3s.values() if url)} found in the static HTML\n")
+        
+        if not all(static_mp3s.get(d['url']) for d in discourse_series):
+            if driver:
+                # Drop the listing pages' network log before the first discourse page
+                driver.get_log('performance')
+            else:
+                driver = start_driver()
         
         for idx, discourse in enumerate(discourse_series, 1):
             print(f"[{idx}/{len(discourse_series)}] {discourse['title'][:65]}")
             
             try:
-                driver.get(discourse['url'])
-                time.sleep(2)
-                
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                
-                # Find MP3 links
-                mp3_links = driver.find_elements(By.CSS_SELECTOR, "a[href$='.mp3']")
+                first_mp3_url = static_mp3s.get(discourse['url'])
                 
-                if mp3_links:
-                    first_mp3_url = mp3_links[0].get_attribute('href')
+                if not first_mp3_url:
+                    driver.get(discourse['url'])
                     
+                    # Find MP3 links: anchors first, then the episode-1 file the player requested
+                    mp3_links = driver.find_elements(By.CSS_SELECTOR, "a[href$='.mp3']")
+                    requested = [url for url in captured_mp3_urls(driver) if FIRST_MP3_SUFFIX_PAT.search(url)]
+                    first_mp3_url = mp3_links[0].get_attribute('href') if mp3_links else next(iter(requested), None)
+                
+                if first_mp3_url:
                     all_mp3_links = generate_mp3_links_from_first(
                         first_mp3_url,
                         discourse['start_episode'],
                         discourse['end_episode']
                     )
                     
-                    all_data.append({
+                    out.write(orjson.dumps({
                         'discourse_name': discourse['title'],
                         'discourse_url': discourse['url'],
                         'mp3_links': all_mp3_links
-                    })
+                    }, option=orjson.OPT_APPEND_NEWLINE))
+                    out.flush()
                     
+                    total_mp3_files += len(all_mp3_links)
                     successful += 1
                     print(f"  ✅ {len(all_mp3_links)} MP3 links generated")
                 else:
@@ -345,25 +540,26 @@ def scrape_osho_mp3_links():
                 failed += 1
                 failed_list.append(discourse['title'])
         
+        out.close()
+        
         # STEP 3: Save final data
         print(f"\n{'='*80}")
         print("STEP 3: SAVING FINAL DATA")
         print(f"{'='*80}")
         
-        with open('osho_mp3_links.json', 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, ensure_ascii=False, indent=2)
-        print("✅ osho_mp3_links.json")
+        ndjson_to_json(ndjson_file, 'osho_mp3_links.json')
+        print(f"✅ osho_mp3_links.json (streamed from {ndjson_file})")
         
         stats = {
             'total_series_found': len(discourse_series),
             'mp3_extraction_successful': successful,
             'mp3_extraction_failed': failed,
             'failed_discourses': failed_list,
-            'total_mp3_files': sum(len(d['mp3_links']) for d in all_data)
+            'total_mp3_files': total_mp3_files
         }
         
-        with open('osho_stats.json', 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        with open('osho_stats.json', 'wb') as f:
+            f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2))
         print("✅ osho_stats.json")
         
         print(f"\n{'='*80}")
@@ -382,10 +578,11 @@ def scrape_osho_mp3_links():
             if len(failed_list) > 10:
                 print(f"  ... and {len(failed_list) - 10} more")
         
-        return all_data
+        return stats
         
     finally:
-        driver.quit()
+        if driver:
+            driver.quit()
 
 if __name__ == "__main__":
     print("\n" + "="*80)
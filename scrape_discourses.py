@@ -1,72 +1,287 @@
 
+import asyncio
 import json
 import re
-import time
 from pathlib import Path
 from typing import List, Dict
 import argparse
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import httpx
+import orjson
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 
+from chrome_setup import block_heavy_resources, chrome_options, driver_path, page_html
+from page_cache import cached_html, chapter_data_from_soup, store_html
 
-PROGRESS_FILE = "progress.json"
 
+PROGRESS_FILE = "progress.json"
+# Completed discourses are appended here as they finish and folded into
+# PROGRESS_FILE every COMPACT_EVERY discourses and at exit
+PROGRESS_JOURNAL = "progress.jsonl"
+COMPACT_EVERY = 50
+
+DURATION_PAT = re.compile(r'\b\d{1,2}:\d{2}:\d{2}\b')
+UNSAFE_FILENAME_PAT = re.compile(r'[\\/*?:":<>|]')
+BOILERPLATE_PAT = re.compile(r'OSHO|Copyright')  # Site name/footer lines, not transcript text
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+FETCH_CONCURRENCY = 20  # Chapter pages downloaded at once
+
+# Transcript containers in order of preference, compiled to XPath once
+TRANSCRIPT_CONTAINERS = [CSSSelector(sel) for sel in (
+    '.article-text',
+    '.entry-content', '.post-content', '.td-post-content', '.tdb-block-inner',
+    'article', '.main-content', '#content', '#main'
+)]
+NON_TEXT_TAGS = ('script', 'style', 'noscript', 'img', 'audio', 'video')
+PARAGRAPH_TAGS = ('p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li')
+# Body text nodes over 50 characters, outside scripts and styles, picked out by libxml2
+LONG_BODY_TEXT = etree.XPath(
+    '//body//text()[not(ancestor::script or ancestor::style)][string-length(normalize-space()) > 50]')
+
+# Wait conditions, built once rather than per chapter
+# (the site's Next.js head uses name=, WordPress pages property=)
+CHAPTER_READY = EC.presence_of_element_located(
+    (By.CSS_SELECTOR, "a[href$='.mp3'], meta[name='og:title'], meta[property='og:title']"))
+
+# Clicks the cookie banner's Accept button if it's already there: one
+# round-trip instead of waiting for a banner that may never appear
+ACCEPT_COOKIES_JS = """
+for (const button of document.querySelectorAll('button')) {
+    if (button.textContent.includes('Accept')) { button.click(); return true; }
+}
+return false;
+"""
 
 def load_progress():
+    """Set of completed discourse URLs from progress.json plus the journal"""
+    completed = set()
     if Path(PROGRESS_FILE).exists():
-        with open(PROGRESS_FILE, "r", encoding="utf-8") as f:
+        with open(PROGRESS_FILE, "rb") as f:
             try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {"completed_discourses": []}
-    return {"completed_discourses": []}
+                completed.update(orjson.loads(f.read()).get("completed_discourses", []))
+            except orjson.JSONDecodeError:
+                pass
+    if Path(PROGRESS_JOURNAL).exists():
+        with open(PROGRESS_JOURNAL, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    completed.add(json.loads(line)["url"])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # e.g. a line cut short by a crash
+    return completed
+
 
+def record_progress(journal, discourse_url):
+    """Append one completed discourse - constant cost however many came before"""
+    journal.write(json.dumps({"url": discourse_url}) + "\n")
 
-def save_progress(completed_discourses):
-    with open(PROGRESS_FILE, "w", encoding="utf-8") as f:
-        json.dump({"completed_discourses": completed_discourses}, f, indent=2)
+
+def save_progress(completed_discourses, journal):
+    """Rewrite progress.json with the full set, then empty the journal it now covers"""
+    tmp_path = Path(PROGRESS_FILE + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps({"completed_discourses": sorted(completed_discourses)}, option=orjson.OPT_INDENT_2))
+    tmp_path.replace(PROGRESS_FILE)
+    journal.truncate(0)
 
 
 def make_driver():
     print("Creating new Chrome driver instance...")
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1200,900")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    options = chrome_options()
+    # Return at DOMContentLoaded; load_chapter waits for the elements it needs
+    options.page_load_strategy = "eager"
+    driver = webdriver.Chrome(service=Service(driver_path()), options=options)
+    # og:image and the .mp3 hrefs are read from the DOM; the payloads aren't needed
+    block_heavy_resources(driver)
     driver.set_page_load_timeout(30)
     print("Chrome driver instance created.")
     return driver
 
 
-def process_discourse(discourse_with_index):
-    discourse_index, discourse = discourse_with_index
-    discourse_id = f"{discourse_index + 1:03}"
-    print(f"Worker processing discourse {discourse_id}: {discourse['discourse_name']}")
+# One Chrome per worker thread, reused for every chapter that thread scrapes
+thread_state = threading.local()
+all_drivers = []
+drivers_lock = threading.Lock()
+
+
+def get_thread_driver():
+    driver = getattr(thread_state, "driver", None)
+    if driver is None:
+        driver = make_driver()
+        thread_state.driver = driver
+        with drivers_lock:
+            all_drivers.append(driver)
+    return driver
 
-    chapters_data = []
 
-    for chapter_index, chapter_url in enumerate(discourse["chapter_links"]):
-        driver = make_driver() # New driver for each chapter
+def reset_thread_driver():
+    # After an error the browser may be wedged; the next chapter gets a fresh one
+    driver = getattr(thread_state, "driver", None)
+    if driver is not None:
+        thread_state.driver = None
+        with drivers_lock:
+            all_drivers.remove(driver)
         try:
-            chapter_id = f"{discourse_id}{chapter_index + 1:03}"
-            print(f"  Scraping chapter {chapter_id}: {chapter_url}")
+            driver.quit()
+        except Exception:
+            pass
+
 
-            chapter_details = extract_chapter(driver, chapter_url)
-            chapter_details["id"] = chapter_id
-            chapters_data.append(chapter_details)
-        except Exception as e:
-            print(f"    Error scraping {chapter_url}: {e}")
-        finally:
-            driver.quit() # Quit driver after each chapter
+def quit_all_drivers():
+    with drivers_lock:
+        for driver in all_drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        all_drivers.clear()
+
+
+def render_chapter(chapter_task):
+    """Rendered source of one chapter from this thread's Chrome, or None on error"""
+    chapter_id, chapter_url = chapter_task
+    print(f"  Scraping chapter {chapter_id} in Chrome: {chapter_url}")
+    try:
+        return load_chapter(get_thread_driver(), chapter_url)
+    except Exception as e:
+        print(f"    Error scraping {chapter_url}: {e}")
+        reset_thread_driver()
+        return None
+
+
+def parse_chapter(chapter_task):
+    """
+    Chapter dict from one page's source; runs in the parser processes.
+    Returns None for a plain-HTTP page without both an MP3 link and a
+    transcript in the raw HTML (Chrome has to render it) or for a page
+    that fails to parse.
+    """
+    chapter_id, chapter_url, html, rendered = chapter_task
+    try:
+        soup = BeautifulSoup(html, 'lxml')
+        chapter = extract_chapter(soup, html, chapter_url)
+    except Exception as e:
+        print(f"    Error parsing {chapter_url}: {e}")
+        return None
+    if not rendered and not (chapter["mp3_links"] and chapter["transcript"]):
+        return None
+    chapter["id"] = chapter_id
+    return chapter
+
+
+async def fetch_page(client, semaphore, url):
+    """Raw HTML of one page, or None if the request failed"""
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.text
+        except httpx.HTTPError as e:
+            print(f"    Static fetch failed for {url}: {e}")
+            return None
+
+
+async def fetch_chapter_pages(urls):
+    """Downloads all the pages concurrently over one keep-alive client; returns {url: html or None}"""
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    limits = httpx.Limits(max_connections=FETCH_CONCURRENCY, max_keepalive_connections=FETCH_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, limits=limits,
+                                 timeout=15, follow_redirects=True) as client:
+        pages = await asyncio.gather(*(fetch_page(client, semaphore, url) for url in urls))
+    return dict(zip(urls, pages))
+
+
+def load_saved_chapters(chapters_file):
+    """Chapters an interrupted run already wrote to the discourse's .chapters.jsonl, by URL"""
+    chapters = {}
+    if chapters_file.exists():
+        with open(chapters_file, "rb") as f:
+            for line in f:
+                try:
+                    chapter = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue  # e.g. a line cut short by a crash
+                chapters[chapter["url"]] = chapter
+    return chapters
+
+
+def save_chapter(saved, chapter):
+    """Append one parsed chapter to the discourse's .chapters.jsonl"""
+    saved.write(orjson.dumps(chapter, option=orjson.OPT_APPEND_NEWLINE))
+    saved.flush()
+
+
+def process_discourse(executor, parser, discourse_with_index):
+    discourse_index, discourse = discourse_with_index
+    discourse_id = f"{discourse_index + 1:03}"
+    print(f"Processing discourse {discourse_id}: {discourse['discourse_name']}")
+
+    # Sanitize the filename
+    safe_filename = UNSAFE_FILENAME_PAT.sub("", discourse["discourse_name"])
+    out_dir = Path("output")
+    output_file = out_dir / f"{safe_filename}.json"
+    # Each chapter is appended here as it's parsed, so an interrupted
+    # discourse resumes where it stopped; rolled up into output_file at the end
+    chapters_file = out_dir / f"{safe_filename}.chapters.jsonl"
+
+    chapters = load_saved_chapters(chapters_file)
+    if chapters:
+        print(f"  Resuming: {len(chapters)} chapters already saved")
+
+    chapter_urls = discourse["chapter_links"]
+    chapter_ids = [f"{discourse_id}{chapter_index + 1:03}" for chapter_index in range(len(chapter_urls))]
+    remaining = [(chapter_id, url) for chapter_id, url in zip(chapter_ids, chapter_urls) if url not in chapters]
+
+    with open(chapters_file, "ab") as saved:
+        # Download every uncached chapter at once
+        pages = {url: cached_html(url) for _, url in remaining}
+        to_fetch = [url for _, url in remaining if pages[url] is None]
+        fetched = asyncio.run(fetch_chapter_pages(to_fetch)) if to_fetch else {}
+
+        # Cached pages are parsed as rendered; a downloaded one only counts
+        # if its content is in the raw HTML
+        parse_tasks = []
+        for chapter_id, url in remaining:
+            if pages[url] is not None:
+                parse_tasks.append((chapter_id, url, pages[url], True))
+            elif fetched.get(url) is not None:
+                parse_tasks.append((chapter_id, url, fetched[url], False))
+
+        # BeautifulSoup runs in the parser processes, off this process's GIL
+        for (_, url, html, rendered), chapter in zip(parse_tasks, parser.map(parse_chapter, parse_tasks)):
+            if chapter:
+                chapters[url] = chapter
+                save_chapter(saved, chapter)
+                if not rendered:
+                    store_html(url, html)
+
+        # Whatever is left is rendered by the worker threads' Chrome instances
+        to_render = [(chapter_id, url) for chapter_id, url in remaining if url not in chapters]
+        if to_render:
+            rendered_pages = executor.map(render_chapter, to_render)
+            parse_tasks = [(chapter_id, url, html, True)
+                           for (chapter_id, url), html in zip(to_render, rendered_pages) if html is not None]
+            for (_, url, html, _), chapter in zip(parse_tasks, parser.map(parse_chapter, parse_tasks)):
+                if chapter:
+                    chapters[url] = chapter
+                    save_chapter(saved, chapter)
+                    # Only pages that rendered their content are worth replaying on the next run
+                    if chapter["transcript"] or chapter["mp3_links"]:
+                        store_html(url, html)
+
+    chapters_data = [chapters[url] for url in chapter_urls if url in chapters]
 
     discourse_data = {
         "id": discourse_id,
@@ -76,168 +291,72 @@ def process_discourse(discourse_with_index):
         "chapters": chapters_data,
     }
 
-    # Sanitize the filename
-    safe_filename = re.sub(r'[\\/*?:":<>|]', "", discourse["discourse_name"])
-    out_dir = Path("output")
-    output_file = out_dir / f"{safe_filename}.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(discourse_data, f, ensure_ascii=False, indent=2)
+    # Written via a temp file, so the .chapters.jsonl is only dropped once the full JSON is in place
+    tmp_path = output_file.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(discourse_data, option=orjson.OPT_INDENT_2))
+    tmp_path.replace(output_file)
+    chapters_file.unlink()
 
     print(f"  Successfully saved to {output_file}")
     return discourse["discourse_url"]
 
 
-
-
 def accept_cookies(driver):
     try:
-        accept_button = WebDriverWait(driver, 5).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]" ))
-        )
-        accept_button.click()
-        time.sleep(1)
+        driver.execute_script(ACCEPT_COOKIES_JS)
     except Exception:
         pass # ignore if not found
 
 
-def extract_chapter(driver, url: str) -> Dict:
+def load_chapter(driver, url: str) -> str:
+    """Open the chapter in Chrome and return the rendered page source"""
     driver.get(url)
-    WebDriverWait(driver, 15).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+    WebDriverWait(driver, 15).until(CHAPTER_READY)
     accept_cookies(driver)
-    time.sleep(0.6) # Small sleep for good measure after cookie acceptance
-
-    # Wait for one of the common content elements to be present
-    content_selectors_for_wait = [
-        (By.CSS_SELECTOR, '.article-text'), # Added this selector
-        (By.CSS_SELECTOR, '.entry-content'),
-        (By.CSS_SELECTOR, '.post-content'),
-        (By.CSS_SELECTOR, 'article'),
-        (By.ID, 'content'),
-        (By.ID, 'main')
-    ]
-    
-    # Try waiting for any of the content selectors
-    waited_for_content = False
-    for selector_type, selector_value in content_selectors_for_wait:
-        try:
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((selector_type, selector_value)))
-            waited_for_content = True
-            break
-        except Exception:
-            continue
-            
-    if not waited_for_content:
-        print(f"Warning: No specific content element found after waiting for {url}. Proceeding with page source.")
-    html = driver.page_source
-
-    # Title: try multiple fallbacks
-    title = ''
-    try:
-        # common WP selectors
-        for sel in ('h1.entry-title', 'h1.post-title', 'h1.page-title', 'h1'):
-            try:
-                el = driver.find_element(By.CSS_SELECTOR, sel)
-                txt = el.text.strip()
-                if txt:
-                    title = txt
-                    break
-            except Exception:
-                continue
-    except Exception:
-        title = ''
-    if not title:
-        # meta og:title or document.title
-        try:
-            og = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-            title = (og.get_attribute('content') or '').strip()
-        except Exception:
-            title = (driver.title or '').strip()
+    return page_html(driver)
 
-    # MP3 links: anchors ending with .mp3 or <audio> sources
-    mp3_links: List[str] = []
-    try:
-        anchors_mp3 = driver.find_elements(By.CSS_SELECTOR, 'a[href$=".mp3"]')
-        for a in anchors_mp3:
-            href = a.get_attribute('href')
-            if href:
-                mp3_links.append(href)
-    except Exception:
-        pass
-    try:
-        sources = driver.find_elements(By.CSS_SELECTOR, 'audio source[src], audio[src]')
-        for s in sources:
-            src = s.get_attribute('src') or s.get_attribute('data-src')
-            if src and src.endswith('.mp3'):
-                mp3_links.append(src)
-    except Exception:
-        pass
 
-    # Image url: try og:image meta or first non-empty image
-    image_url = ''
-    try:
-        og = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-        image_url = og.get_attribute('content') or ''
-    except Exception:
-        try:
-            imgs = driver.find_elements(By.CSS_SELECTOR, 'img[src*="/_next/image?url="]')
-            for i in imgs:
-                src = i.get_attribute('src')
-                if src:
-                    image_url = src
-                    break
-        except Exception:
-            image_url = ''
+def extract_chapter(soup, html: str, url: str) -> Dict:
+    # Title, MP3 links and image from the parsed page - no WebDriver calls
+    page_data = chapter_data_from_soup(soup, url)
+
+    title = page_data['title']
+    mp3_links: List[str] = page_data['mp3_links']
+    image_url = page_data['image_url']
 
     # Duration: regex search for hh:mm:ss
     duration = ''
-    m = re.search(r'\b\d{1,2}:\d{2}:\d{2}\b', html)
+    m = DURATION_PAT.search(html)
     if m:
         duration = m.group(0)
 
-    # Transcript: try several likely containers with HTML handling (preserve <br> breaks)
-    transcript_paragraphs = []
-    soup = BeautifulSoup(html, 'html.parser')
-
-    content_selectors = [
-        '.article-text', # Added this selector
-        '.entry-content', '.post-content', '.td-post-content', '.tdb-block-inner',
-        'article', '.main-content', '#content', '#main'
-    ]
-
+    # Transcript: try several likely containers, walked with lxml rather
+    # than BeautifulSoup's Python-level tree
+    tree = lxml.html.fromstring(html)
     content_element = None
-    for selector in content_selectors:
-        content_element = soup.select_one(selector)
-        if content_element:
+    for container in TRANSCRIPT_CONTAINERS:
+        found = container(tree)
+        if found:
+            content_element = found[0]
             break
 
-    if content_element:
-        # Remove script and style tags
-        for unwanted_tag in content_element(['script', 'style', 'noscript', 'img', 'audio', 'video']):
-            unwanted_tag.decompose()
-
-        # Extract text, preserving paragraph structure
-        for p in content_element.find_all(['p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li']):
-            text = p.get_text(separator=' ', strip=True)
-            # Apply filtering similar to the fallback, but slightly adjusted
-            if text and len(text) > 30 and "OSHO" not in text and "Copyright" not in text: # Increased min length for more robust filtering
-                transcript_paragraphs.append(text)
-    else:
-        # Fallback to body text if no specific content element is found
-        body_text = soup.body.get_text(separator='\n', strip=True) if soup.body else ''
-        lines = body_text.split('\n')
-        transcript_paragraphs = [line.strip() for line in lines if len(line.strip()) > 50 and "OSHO" not in line and "Copyright" not in line]
-
-    # Post-processing: remove empty strings and join with double newlines for paragraph separation
-    transcript_paragraphs = [p for p in transcript_paragraphs if p]
-
-
+    if content_element is not None:
+        # Remove script, style and media elements (keeping the text after them)
+        etree.strip_elements(content_element, *NON_TEXT_TAGS, with_tail=False)
 
+        # Extract text, preserving paragraph structure; anything of 30
+        # characters or less, or with site boilerplate, is dropped
+        paragraphs = (' '.join(p.text_content().split()) for p in content_element.iterdescendants(*PARAGRAPH_TAGS))
+        transcript_paragraphs = [text for text in paragraphs if len(text) > 30 and not BOILERPLATE_PAT.search(text)]
+    else:
+        # Fallback to the body's longer text nodes if no specific content element is found
+        transcript_paragraphs = [text.strip() for text in LONG_BODY_TEXT(tree) if not BOILERPLATE_PAT.search(text)]
 
     # assemble
     chapter = {
         'title': title,
         'url': url,
-        'mp3_links': list(dict.fromkeys(mp3_links)),
+        'mp3_links': mp3_links,
         'image_url': image_url,
         'duration': duration,
         'transcript': transcript_paragraphs,
@@ -246,14 +365,13 @@ def extract_chapter(driver, url: str) -> Dict:
 
 
 def main(count, workers):
-    with open("chapter_links.json", "r", encoding="utf-8") as f:
-        all_discourses = json.load(f)
+    with open("chapter_links.json", "rb") as f:
+        all_discourses = orjson.loads(f.read())
 
     out_dir = Path("output")
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    progress = load_progress()
-    completed_discourses = set(progress.get("completed_discourses", []))
+    completed_discourses = load_progress()
 
     # Filter out completed discourses
     discourses_to_process = [
@@ -269,13 +387,24 @@ def main(count, workers):
         return
 
     print(f"Starting ThreadPoolExecutor with {workers} workers.")
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        results = executor.map(process_discourse, discourses_to_process)
-        for discourse_url in results:
-            if discourse_url:
-                completed_discourses.add(discourse_url)
-                save_progress(list(completed_discourses))
-
+    # Line-buffered: each URL is on disk as soon as its discourse is saved
+    journal = open(PROGRESS_JOURNAL, "a", encoding="utf-8", buffering=1)
+    since_compact = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor, ProcessPoolExecutor() as parser:
+            for discourse_with_index in discourses_to_process:
+                discourse_url = process_discourse(executor, parser, discourse_with_index)
+                if discourse_url:
+                    completed_discourses.add(discourse_url)
+                    record_progress(journal, discourse_url)
+                    since_compact += 1
+                    if since_compact >= COMPACT_EVERY:
+                        save_progress(completed_discourses, journal)
+                        since_compact = 0
+    finally:
+        save_progress(completed_discourses, journal)
+        journal.close()
+        quit_all_drivers()
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Scrape OSHO discourses.")
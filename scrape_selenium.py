@@ -1,47 +1,180 @@
 import re
-import json
-import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
 from pathlib import Path
 from typing import List, Dict
 
+import httpx
+import orjson
+import soupsieve as sv
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+from chrome_setup import block_heavy_resources, chrome_options, driver_path, page_html
+from page_cache import chapter_data_from_soup
+
+BY_PAT = re.compile(r'-by-.*$')
+RANGE_PAT = re.compile(r'-\d+-\d+$')
+URL_CHAPTER_PAT = re.compile(r'-?(\d{1,3})$')
+TITLE_CHAPTER_PAT = re.compile(r'(?:\b|\D)(\d{1,3})\b')
+LANGUAGE_WORD_PAT = re.compile(r'language', re.I)
+LANGUAGE_LABEL_PAT = re.compile(r'[Ll]anguage\s*[:\-\u00A0]?\s*([A-Za-z\u0900-\u097F\u0400-\u04FF]+)')
+LANGUAGE_HTML_PAT = re.compile(r'Language\s*[:\-\u00A0]?\s*([A-Za-z\u0900-\u097F\u0400-\u04FF]+)', re.I)
+DURATION_PAT = re.compile(r'\b\d{1,2}:\d{2}:\d{2}\b')
+BR_PAT = re.compile(r'<br\s*/?>', re.IGNORECASE)
+TAG_PAT = re.compile(r'<[^>]+>')
+BLANK_LINES_PAT = re.compile(r'\n\s*\n+')
+NEWLINES_PAT = re.compile(r'\n+')
+
+# Language names to look for anywhere in the page, in order of preference
+KNOWN_LANGUAGES = {
+    'hindi': ['हिन्दी', 'हिंदी', 'hindi'],
+    'english': ['english', 'eng', 'en', 'अंग्रेज़ी', 'अंग्रेजी'],
+    'sanskrit': ['sanskrit', 'संस्कृत'],
+    'gujarati': ['gujarati', 'ગુજરાતી'],
+    'bengali': ['bengali', 'বাংলা'],
+    'tamil': ['tamil', 'தமிழ்'],
+    'telugu': ['telugu', 'తెలుగు'],
+    'kannada': ['kannada', 'ಕನ್ನಡ'],
+    'malayalam': ['malayalam', 'മലയാളം'],
+    'urdu': ['urdu', 'اردو'],
+    'punjabi': ['punjabi', 'ਪੰਜਾਬੀ']
+}
+LANGUAGE_TOKENS = {v.lower(): canon for canon, variants in KNOWN_LANGUAGES.items() for v in variants}
+LANGUAGE_RANK = {canon: rank for rank, canon in enumerate(KNOWN_LANGUAGES)}
+# Longest first, so 'english' wins over its prefix 'en' at the same position
+KNOWN_LANGUAGE_PAT = re.compile(
+    '|'.join(re.escape(v) for v in sorted(LANGUAGE_TOKENS, key=len, reverse=True)), re.IGNORECASE)
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+# A server-rendered chapter has its MP3 link in the raw HTML
+STATIC_MP3 = sv.compile('a[href$=".mp3"], audio source[src], audio[src]')
+TRANSCRIPT_SELECTORS = [
+    'div.entry-content', 'div.post-content', 'article .entry-content', 'article', 'div#content', 'div.post', 'div.post-inner'
+]
+# Compiled once for the soup; RENDERED_TRANSCRIPT_JS gets the plain strings
+TRANSCRIPT_CONTAINERS = [sv.compile(sel) for sel in TRANSCRIPT_SELECTORS]
+# The site's Next.js chapters keep the transcript in one <br>-separated div
+BR_BLOCKS = sv.compile(':has(> br)')
+PARAGRAPHS = sv.compile('p')
+# Listing-page anchors, read from an lxml tree whose links are made absolute in one pass
+TABLE_LINKS = CSSSelector('table a[href]')
+ALL_LINKS = CSSSelector('a[href]')
+
+# Wait conditions, built once rather than per page
+# The site's chapter markup has none of TRANSCRIPT_SELECTORS, but always has these
+CHAPTER_READY = EC.presence_of_element_located(
+    (By.CSS_SELECTOR, "a[href$='.mp3'], meta[name='og:title'], meta[property='og:title']"))
+ACCEPT_BUTTON_CLICKABLE = EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]"))
+
+# Rendered-text transcript fallbacks, tried in order inside the page:
+# the first selector whose element has more than 40 characters, else up to
+# 10 paragraphs over 80 characters, else up to 20 body lines over 100
+RENDERED_TRANSCRIPT_JS = """
+for (const sel of arguments[0]) {
+    const el = document.querySelector(sel);
+    const text = el ? el.innerText.trim() : '';
+    if (text.length > 40) return text;
+}
+const paragraphs = Array.from(document.querySelectorAll('p'), p => p.innerText.trim()).filter(p => p.length > 80);
+if (paragraphs.length) return paragraphs.slice(0, 10).join('\\n\\n');
+const body = document.body ? document.body.innerText : '';
+return body.split('\\n').map(line => line.trim()).filter(line => line.length > 100).slice(0, 20).join('\\n');
+"""
 
 
 def make_driver(headless=True):
-    options = webdriver.ChromeOptions()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1200,900")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    options = chrome_options(headless=headless)
+    # Return at DOMContentLoaded; callers wait for what they need
+    options.page_load_strategy = 'eager'
+    driver = webdriver.Chrome(service=Service(driver_path()), options=options)
+    # The MP3 and image URLs are read from the DOM; the payloads aren't needed
+    block_heavy_resources(driver)
     driver.set_page_load_timeout(30)
     return driver
 
 
+# Per worker process: a keep-alive HTTP client, and a Chrome started on
+# the first page that needs it and reused for every series after that
+WORKER_CLIENT = None
+WORKER_DRIVER = None
+
+
+def init_worker():
+    global WORKER_CLIENT
+    WORKER_CLIENT = httpx.Client(http2=True, headers=HEADERS, timeout=15, follow_redirects=True)
+    # atexit handlers don't run in forked pool workers; multiprocessing's exit finalizers do
+    Finalize(None, close_worker, exitpriority=10)
+
+
+def get_worker_driver():
+    global WORKER_DRIVER
+    if WORKER_DRIVER is None:
+        WORKER_DRIVER = make_driver(headless=True) # running headless for speed
+    return WORKER_DRIVER
+
+
+def close_worker_driver():
+    global WORKER_DRIVER
+    if WORKER_DRIVER is not None:
+        try:
+            WORKER_DRIVER.quit()
+        except Exception:
+            pass
+        WORKER_DRIVER = None
+
+
+def close_worker():
+    close_worker_driver()
+    if WORKER_CLIENT is not None:
+        WORKER_CLIENT.close()
+
+
+def known_language(html):
+    """
+    The most preferred KNOWN_LANGUAGES entry named anywhere in html, or ''.
+    One case-insensitive pass instead of a lower() copy plus a scan per name.
+    """
+    best = ''
+    for m in KNOWN_LANGUAGE_PAT.finditer(html):
+        canon = LANGUAGE_TOKENS[m.group(0).lower()]
+        if not best or LANGUAGE_RANK[canon] < LANGUAGE_RANK[best]:
+            best = canon
+            if LANGUAGE_RANK[best] == 0:
+                break
+    return best
+
+
+def document_complete(driver):
+    return driver.execute_script('return document.readyState') == 'complete'
+
+
 def accept_cookies(driver):
     try:
-        accept_button = WebDriverWait(driver, 5).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]"))
-        )
+        accept_button = WebDriverWait(driver, 5).until(ACCEPT_BUTTON_CLICKABLE)
         accept_button.click()
-        time.sleep(1)
+        # Continue as soon as the banner is gone rather than after a fixed second
+        WebDriverWait(driver, 3).until(EC.invisibility_of_element(accept_button))
     except Exception:
         pass # ignore if not found
 
 
 def find_chapter_links(driver, list_url: str) -> List[str]:
     driver.get(list_url)
-    WebDriverWait(driver, 10).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+    WebDriverWait(driver, 10).until(document_complete)
     accept_cookies(driver)
     base = '/'.join(list_url.split('/')[:3])
     slug = list_url.rstrip('/').split('/')[-1].split('#')[0]
-    prefix = re.sub(r'-by-.*$', '', slug)
+    prefix = BY_PAT.sub('', slug)
+    prefix_pat = re.compile(rf'/{re.escape(prefix)}-\d+')
     links: List[str] = []
 
     while True:
@@ -49,55 +182,46 @@ def find_chapter_links(driver, list_url: str) -> List[str]:
         last_height = driver.execute_script("return document.body.scrollHeight")
         for _ in range(5):
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            # Stop once the page stops growing instead of sleeping a second per scroll
+            try:
+                WebDriverWait(driver, 3).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight") != last_height
+                )
+            except TimeoutException:
                 break
-            last_height = new_height
+            last_height = driver.execute_script("return document.body.scrollHeight")
+
+        # One snapshot of the page for all three passes, rather than a
+        # find_elements sweep plus a get_attribute round-trip per anchor
+        tree = lxml.html.fromstring(page_html(driver))
+        tree.make_links_absolute(driver.current_url)
+        table_hrefs = [a.get('href') for a in TABLE_LINKS(tree)]
+        all_hrefs = [a.get('href') for a in ALL_LINKS(tree)]
 
         # 1) Prefer explicit links inside any table (series/episode tables)
-        try:
-            table_anchors = driver.find_elements(By.CSS_SELECTOR, 'table a[href]')
-            for a in table_anchors:
-                href = a.get_attribute('href')
-                if href and href.startswith(base) and href not in links:
-                    links.append(href)
-        except Exception:
-            pass
+        for href in table_hrefs:
+            if href.startswith(base) and href not in links:
+                links.append(href)
 
         # 2) Next, look for anchors that match the series prefix like '/{prefix}-<number>'
-        try:
-            anchors = driver.find_elements(By.CSS_SELECTOR, "a[href]")
-            pat = re.compile(rf'/{re.escape(prefix)}-\d+')
-            for a in anchors:
-                href = a.get_attribute('href')
-                if not href or not href.startswith(base):
-                    continue
-                if href in links:
-                    continue
-                if pat.search(href):
-                    links.append(href)
-        except Exception:
-            pass
+        for href in all_hrefs:
+            if href.startswith(base) and href not in links and prefix_pat.search(href):
+                links.append(href)
 
         # 3) Fallback: any internal links (keeps previous behavior)
         if not links:
-            try:
-                anchors = driver.find_elements(By.CSS_SELECTOR, "a[href]")
-                for a in anchors:
-                    href = a.get_attribute('href')
-                    if href and href.startswith(base) and href not in links:
-                        links.append(href)
-            except Exception:
-                pass
-        
+            for href in all_hrefs:
+                if href.startswith(base) and href not in links:
+                    links.append(href)
+
         # pagination
         try:
             next_button = driver.find_element(By.XPATH, "//a[contains(text(), 'Next')]")
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-            time.sleep(1)
+            old_url = driver.current_url
             next_button.click()
-            time.sleep(2) # wait for page to load
+            # wait for the next page (full load or client-side route change)
+            WebDriverWait(driver, 10).until(EC.url_changes(old_url))
         except Exception:
             break
 
@@ -116,43 +240,90 @@ def filter_out_assets(urls: List[str]) -> List[str]:
     return cleaned
 
 
-def extract_chapter(driver, url: str) -> Dict:
+def fetch_static_page(client, url: str):
+    """Raw HTML of the chapter over plain HTTP, or None if the request failed"""
+    try:
+        response = client.get(url)
+        response.raise_for_status()
+        return response.text
+    except httpx.HTTPError:
+        return None
+
+
+def load_rendered_page(driver, url: str) -> str:
+    # driver.get returns at DOMContentLoaded (eager); wait for the chapter's
+    # MP3 link or title meta rather than for every subresource to finish
     driver.get(url)
-    WebDriverWait(driver, 15).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+    try:
+        WebDriverWait(driver, 15).until(CHAPTER_READY)
+    except TimeoutException:
+        pass # the rendered-text fallbacks still get a go
     accept_cookies(driver)
-    time.sleep(0.6)
-    html = driver.page_source
+    return page_html(driver)
 
-    # Title: try multiple fallbacks
-    title = ''
-    try:
-        # common WP selectors
-        for sel in ('h1.entry-title', 'h1.post-title', 'h1.page-title', 'h1'):
-            try:
-                el = driver.find_element(By.CSS_SELECTOR, sel)
-                txt = el.text.strip()
-                if txt:
-                    title = txt
-                    break
-            except Exception:
-                continue
-    except Exception:
-        title = ''
-    if not title:
-        # meta og:title or document.title
-        try:
-            og = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-            title = (og.get_attribute('content') or '').strip()
-        except Exception:
-            title = (driver.title or '').strip()
+
+def text_with_breaks(el) -> str:
+    """Text of an element with its <br> breaks kept"""
+    # Get HTML and convert <br> to newlines, then extract text to preserve breaks
+    html_content = el.decode_contents() if el else ''
+    # Replace <br> and <br/> and <br /> with newlines
+    html_content = BR_PAT.sub('\n', html_content)
+    # Remove HTML tags but keep newlines
+    text_only = TAG_PAT.sub('', html_content)
+    # Clean up extra whitespace while preserving intentional breaks
+    return BLANK_LINES_PAT.sub('\n\n', text_only).strip()
+
+
+def soup_transcript(soup) -> str:
+    """
+    Text of the first likely container with more than 40 characters, else
+    of the element with the most <br> line breaks, else up to 10 paragraphs
+    over 80 characters - the soup's version of RENDERED_TRANSCRIPT_JS.
+    """
+    for container in TRANSCRIPT_CONTAINERS:
+        text_only = text_with_breaks(container.select_one(soup))
+        if len(text_only) > 40:
+            return text_only
+
+    br_block = max(BR_BLOCKS.select(soup), key=lambda el: len(el.find_all('br', recursive=False)), default=None)
+    text_only = text_with_breaks(br_block)
+    if len(text_only) > 40:
+        return text_only
+
+    paragraphs = [text for text in (p.get_text().strip() for p in PARAGRAPHS.select(soup)) if len(text) > 80]
+    return '\n\n'.join(paragraphs[:10])
+
+
+def rendered_transcript(driver) -> str:
+    """Fallbacks on Chrome's rendered text, all in one execute_script round-trip"""
+    return driver.execute_script(RENDERED_TRANSCRIPT_JS, TRANSCRIPT_SELECTORS) or ''
+
+
+def extract_chapter(get_driver, client, url: str, dynamic: bool = False) -> Dict:
+    # Plain HTTP first; Chrome is only started for pages whose transcript or
+    # MP3 link isn't in the raw HTML (or for every page with --dynamic)
+    html = None if dynamic else fetch_static_page(client, url)
+    soup = BeautifulSoup(html, 'lxml') if html is not None else None
+    transcript_full = soup_transcript(soup) if soup is not None and STATIC_MP3.select_one(soup) else ''
+
+    if not transcript_full:
+        driver = get_driver()
+        html = load_rendered_page(driver, url)
+        soup = BeautifulSoup(html, 'lxml')
+        transcript_full = soup_transcript(soup) or rendered_transcript(driver)
+
+    page_data = chapter_data_from_soup(soup, url)
+    title = page_data['title']
+    mp3_links: List[str] = page_data['mp3_links']
+    image_url = page_data['image_url']
 
     # Chapter number: from URL or from title
     chapter_number = ''
-    m = re.search(r'-?(\d{1,3})$', url.rstrip('/'))
+    m = URL_CHAPTER_PAT.search(url.rstrip('/'))
     if m:
         chapter_number = m.group(1)
     else:
-        m2 = re.search(r'(?:\b|\D)(\d{1,3})\b', title)
+        m2 = TITLE_CHAPTER_PAT.search(title)
         if m2:
             chapter_number = m2.group(1)
 
@@ -160,46 +331,27 @@ def extract_chapter(driver, url: str) -> Dict:
     language = ''
     try:
         # prefer visible 'Language' label in page text nodes
-        els = driver.find_elements(By.XPATH, "//*[contains(translate(text(), 'LANGUAGE', 'language'), 'language')]")
-        for el in els:
-            txt = el.text.strip()
+        for node in soup.find_all(string=LANGUAGE_WORD_PAT):
+            if node.parent.name in ('script', 'style'):
+                continue
+            txt = node.parent.get_text(' ').strip()
             if not txt:
                 continue
-            m = re.search(r'[Ll]anguage\s*[:\-\u00A0]?\s*([A-Za-z\u0900-\u097F\u0400-\u04FF]+)', txt)
+            m = LANGUAGE_LABEL_PAT.search(txt)
             if m:
                 language = m.group(1).strip()
                 break
         # try regex over page source for a word-like token after 'Language'
         if not language:
-            m2 = re.search(r'Language\s*[:\-\u00A0]?\s*([A-Za-z\u0900-\u097F\u0400-\u04FF]+)', html, re.I)
+            m2 = LANGUAGE_HTML_PAT.search(html)
             if m2:
                 language = m2.group(1).strip()
         # fallback: search for known language names anywhere in the HTML
         if not language:
-            known_map = {
-                'hindi': ['हिन्दी', 'हिंदी', 'hindi'],
-                'english': ['english', 'eng', 'en', 'अंग्रेज़ी', 'अंग्रेजी'],
-                'sanskrit': ['sanskrit', 'संस्कृत'],
-                'gujarati': ['gujarati', 'ગુજરાતી'],
-                'bengali': ['bengali', 'বাংলা'],
-                'tamil': ['tamil', 'தமிழ்'],
-                'telugu': ['telugu', 'తెలుగు'],
-                'kannada': ['kannada', 'ಕನ್ನಡ'],
-                'malayalam': ['malayalam', 'മലയാളം'],
-                'urdu': ['urdu', 'اردو'],
-                'punjabi': ['punjabi', 'ਪੰਜਾਬੀ']
-            }
-            lower_html = html.lower()
-            for canon, variants in known_map.items():
-                for v in variants:
-                    if v.lower() in lower_html:
-                        language = canon
-                        break
-                if language:
-                    break
+            language = known_language(html)
         # final fallback: html lang attribute mapping
         if not language:
-            lang_attr = (driver.find_element(By.CSS_SELECTOR, 'html').get_attribute('lang') or '').strip()
+            lang_attr = ((soup.html.get('lang') if soup.html else '') or '').strip()
             if lang_attr:
                 lang_map = {'hi': 'hindi', 'en': 'english'}
                 language = lang_map.get(lang_attr.lower(), lang_attr.lower())
@@ -213,99 +365,13 @@ def extract_chapter(driver, url: str) -> Dict:
 
     # Duration: regex search for hh:mm:ss
     duration = ''
-    m = re.search(r'\b\d{1,2}:\d{2}:\d{2}\b', html)
+    m = DURATION_PAT.search(html)
     if m:
         duration = m.group(0)
 
-    # MP3 links: anchors ending with .mp3 or <audio> sources
-    mp3_links: List[str] = []
-    try:
-        anchors_mp3 = driver.find_elements(By.CSS_SELECTOR, 'a[href$=".mp3"]')
-        for a in anchors_mp3:
-            href = a.get_attribute('href')
-            if href:
-                mp3_links.append(href)
-    except Exception:
-        pass
-    try:
-        sources = driver.find_elements(By.CSS_SELECTOR, 'audio source[src], audio[src]')
-        for s in sources:
-            src = s.get_attribute('src') or s.get_attribute('data-src')
-            if src and src.endswith('.mp3'):
-                mp3_links.append(src)
-    except Exception:
-        pass
-
-    # Image url: try og:image meta or first non-empty image
-    image_url = ''
-    try:
-        og = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-        image_url = og.get_attribute('content') or ''
-    except Exception:
-        try:
-            imgs = driver.find_elements(By.CSS_SELECTOR, 'img')
-            for i in imgs:
-                src = i.get_attribute('src') or i.get_attribute('data-src')
-                if src and 'no_image' not in src:
-                    image_url = src
-                    break
-        except Exception:
-            image_url = ''
-
-    # Transcript: try several likely containers with HTML handling (preserve <br> breaks)
-    transcript_full = ''
-    tried_selectors = [
-        'div.entry-content', 'div.post-content', 'article .entry-content', 'article', 'div#content', 'div.post', 'div.post-inner'
-    ]
-    for sel in tried_selectors:
-        try:
-            el = driver.find_element(By.CSS_SELECTOR, sel)
-            # Get HTML and convert <br> to newlines, then extract text to preserve breaks
-            html_content = el.get_attribute('innerHTML')
-            if html_content:
-                # Replace <br> and <br/> and <br /> with newlines
-                html_content = re.sub(r'<br\s*/?>', '\n', html_content, flags=re.IGNORECASE)
-                # Remove HTML tags but keep newlines
-                text_only = re.sub(r'<[^>]+>', '', html_content)
-                # Clean up extra whitespace while preserving intentional breaks
-                text_only = re.sub(r'\n\s*\n+', '\n\n', text_only).strip()
-                if len(text_only) > 40:
-                    transcript_full = text_only
-                    break
-        except Exception:
-            pass
-    
-    # Fallback to rendered text if above didn't work
-    if not transcript_full:
-        for sel in tried_selectors:
-            try:
-                el = driver.find_element(By.CSS_SELECTOR, sel)
-                text = el.text.strip()
-                if len(text) > 40:
-                    transcript_full = text
-                    break
-            except Exception:
-                continue
-
-    if not transcript_full:
-        ps = driver.find_elements(By.CSS_SELECTOR, 'p')
-        longps = [p.text.strip() for p in ps if len(p.text.strip()) > 80]
-        if longps:
-            transcript_full = '\n\n'.join(longps[:10])
-
-    if not transcript_full:
-        # final fallback: use large chunk of body text
-        try:
-            body = driver.find_element(By.CSS_SELECTOR, 'body').text or ''
-            transcript_full = '\n'.join([line.strip() for line in body.splitlines() if len(line.strip()) > 100][:20])
-        except Exception:
-            transcript_full = ''
-
-    # Split transcript into paragraphs for caption generation
-    transcript_paragraphs = []
-    if transcript_full:
-        # Split by one or more newlines
-        transcript_paragraphs = [p.strip() for p in re.split(r'\n+', transcript_full) if p.strip()]
+    # Split transcript into paragraphs for caption generation (by one or
+    # more newlines; each piece stripped once, blank ones dropped)
+    transcript_paragraphs = [p for p in map(str.strip, NEWLINES_PAT.split(transcript_full)) if p]
 
     # assemble
     chapter = {
@@ -315,7 +381,7 @@ def extract_chapter(driver, url: str) -> Dict:
         'language': language,
         'duration': duration,
         'image_url': image_url,
-        'mp3_links': list(dict.fromkeys(mp3_links)),
+        'mp3_links': mp3_links,
         'transcript': transcript_full,  # Full text with breaks preserved
         'transcript_paragraphs': transcript_paragraphs,  # Split for caption generation
     }
@@ -329,16 +395,15 @@ def save_per_language(item: Dict, out_dir: Path):
     data = []
     if fname.exists():
         try:
-            with fname.open('r', encoding='utf-8') as f:
-                data = json.load(f)
+            with fname.open('rb') as f:
+                data = orjson.loads(f.read())
         except Exception:
             data = []
     urls = {d.get('url') for d in data}
     if item['url'] not in urls:
         data.append(item)
         tmp = fname.with_suffix('.tmp')
-        with tmp.open('w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         tmp.replace(fname)
 
 
@@ -351,72 +416,86 @@ def save_discourse_json(discourse_name: str, discourse_url: str, chapters: List[
         'chapters': chapters,
     }
     tmp = fname.with_suffix('.tmp')
-    with tmp.open('w', encoding='utf-8') as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
     tmp.replace(fname)
 
 
-def main():
-    # Load all series
-    hindi_series = []
-    with open("hindi-names.json", "r", encoding="utf-8") as f:
-        hindi_series = json.load(f)
-
-    english_series = []
-    with open("eng-names.json", "r", encoding="utf-8") as f:
-        english_series = json.load(f)
+def scrape_series(series: Dict, out_dir: Path, dynamic: bool = False):
+    title = series["title"]
+    series_url = series["url"]
+    start_ep = series.get("start_episode")
+    end_ep = series.get("end_episode")
 
-    all_series = hindi_series + english_series
-    print(f"Loaded {len(all_series)} series to scrape.")
+    print(f"Processing series: {title}")
 
-    out_dir = Path("output")
-    out_dir.mkdir(parents=True, exist_ok=True)
+    # Generate chapter links
+    slug = series_url.rstrip('/').split('/')[-1]
+    prefix = BY_PAT.sub('', slug)
+    prefix = RANGE_PAT.sub('', prefix) # remove chapter range
+    base_url = '/'.join(series_url.split('/')[:-1])
 
-    driver = make_driver(headless=True) # running headless for speed
-    try:
-        for series in all_series:
-            title = series["title"]
-            series_url = series["url"]
-            start_ep = series.get("start_episode")
-            end_ep = series.get("end_episode")
+    links = [f"{base_url}/{prefix}-{i}" for i in range(start_ep, end_ep + 1)]
 
+    print(f'Found {len(links)} candidate chapter links')
 
-            slug = series_url.rstrip('/').split('/')[-1]
-            out_path = out_dir / f"{slug}.json"
-            if out_path.exists():
-                print(f"Skipping already scraped: {title}")
-                continue
+    chapters: List[Dict] = []
+    for i, l in enumerate(links, 1):
+        print(f'[{i}/{len(links)}] Visiting {l}')
+        try:
+            item = extract_chapter(get_worker_driver, WORKER_CLIENT, l, dynamic)
+            chapters.append(item)
+        except Exception as e:
+            print('Error extracting', l, e)
+            # The browser may be wedged; the next page that needs one gets a fresh one
+            close_worker_driver()
 
-            print(f"Processing series: {title}")
+    # save per-discourse JSON (each series has its own file, so workers never share one)
+    save_discourse_json(title, series_url, chapters, out_dir)
+    return title
 
-            if not start_ep or not end_ep:
-                print(f"Skipping {title} because of missing start/end episode.")
-                continue
 
-            # Generate chapter links
-            slug = series_url.rstrip('/').split('/')[-1]
-            prefix = re.sub(r'-by-.*$', '', slug)
-            prefix = re.sub(r'-\d+-\d+$', '', prefix) # remove chapter range
-            base_url = '/'.join(series_url.split('/')[:-1])
-
-            links = [f"{base_url}/{prefix}-{i}" for i in range(start_ep, end_ep + 1)]
+def main(dynamic=False, workers=8):
+    # Load all series
+    hindi_series = []
+    with open("hindi-names.json", "rb") as f:
+        hindi_series = orjson.loads(f.read())
 
-            print(f'Found {len(links)} candidate chapter links')
+    english_series = []
+    with open("eng-names.json", "rb") as f:
+        english_series = orjson.loads(f.read())
 
-            chapters: List[Dict] = []
-            for i, l in enumerate(links, 1):
-                print(f'[{i}/{len(links)}] Visiting {l}')
-                try:
-                    item = extract_chapter(driver, l)
-                    chapters.append(item)
-                except Exception as e:
-                    print('Error extracting', l, e)
+    all_series = hindi_series + english_series
+    print(f"Loaded {len(all_series)} series to scrape.")
 
-            # save per-discourse JSON
-            save_discourse_json(title, series_url, chapters, out_dir)
-    finally:
-        driver.quit()
+    out_dir = Path("output")
+    out_dir.mkdir(parents=True, exist_ok=True)
 
+    pending = []
+    for series in all_series:
+        title = series["title"]
+        slug = series["url"].rstrip('/').split('/')[-1]
+        if (out_dir / f"{slug}.json").exists():
+            print(f"Skipping already scraped: {title}")
+            continue
+        if not series.get("start_episode") or not series.get("end_episode"):
+            print(f"Skipping {title} because of missing start/end episode.")
+            continue
+        pending.append(series)
+
+    print(f"Scraping {len(pending)} series with {workers} worker processes.")
+    # Parsing runs in each worker process too, so it isn't serialised on one GIL
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        futures = {executor.submit(scrape_series, series, out_dir, dynamic): series["title"]
+                   for series in pending}
+        for future in as_completed(futures):
+            try:
+                print(f"Saved series: {future.result()}")
+            except Exception as e:
+                print(f"Error scraping series {futures[future]}: {e}")
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Scrape OSHO series chapters.")
+    parser.add_argument("--dynamic", action="store_true", help="Render every chapter in Chrome instead of trying plain HTTP first.")
+    parser.add_argument("--workers", type=int, default=8, help="Number of series scraped at once.")
+    args = parser.parse_args()
+    main(dynamic=args.dynamic, workers=args.workers)
@@ -1,4 +1,3 @@
-import json
 import re
 import time
 from pathlib import Path
@@ -7,23 +6,27 @@ import argparse
 from concurrent.futures import ProcessPoolExecutor
 import os
 import difflib
+from functools import partial
 
+import httpx
+import orjson
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
+from chrome_setup import block_heavy_resources, chrome_options, driver_path, page_html
+from page_cache import cached_html, chapter_data_from_soup, store_html
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════
 
 WAIT_DOCUMENT_READY = 0
-WAIT_COOKIE_POPUP = 1
 WAIT_DYNAMIC_CONTENT = 0
 WAIT_CONTENT_ELEMENT = 0
 WAIT_RETRY_DELAY = 1
@@ -37,6 +40,36 @@ ENABLE_JAVASCRIPT = True
 
 PROGRESS_FILE = "progress.json"
 WORKER_DRIVER = None  # Global driver for connection pooling
+WORKER_CLIENT = None  # Per-process keep-alive HTTP client for server-rendered pages
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+DURATION_PAT = re.compile(r'\b\d{1,2}:\d{2}:\d{2}\b')
+TRAILING_NUMBER_PAT = re.compile(r'\d+$')
+TIMESTAMP_LINE_PAT = re.compile(r'^\d{2}:\d{2}(?::\d{2})?$')
+DATE_PAT = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(st|nd|rd|th)?,?\s+\d{4}', re.IGNORECASE)
+UNSAFE_FILENAME_PAT = re.compile(r'[\\/*?:":<>|]')
+VOL_PADDED_PAT = re.compile(r'vol-0(\d)')
+VOL_SINGLE_DIGIT_PAT = re.compile(r'vol-\d(?:-|$)')
+VOL_DIGIT_PAT = re.compile(r'vol-(\d)')
+
+# Wait conditions, built once rather than per page load
+BODY_PRESENT = EC.presence_of_element_located((By.TAG_NAME, "body"))
+CONTENT_PRESENT = EC.presence_of_element_located((By.ID, "content"))
+
+# Clicks the cookie banner's Accept button if it's already there: one
+# round-trip instead of waiting for a banner that may never appear
+ACCEPT_COOKIES_JS = """
+for (const button of document.querySelectorAll('button')) {
+    if (button.textContent.includes('Accept')) { button.click(); return true; }
+}
+return false;
+"""
+
+# Site navigation/footer lines that show up in the page text; built once, not per chapter
+BANNED_PHRASES = {
+    "Home", "OSHO", "About Osho", "Osho Biography", "Osho on Mystic", "Osho Photo Gallery", "Osho Dham", "Upcoming Events", "Meditation Programs", "Meditation", "Active Meditation", "Passive Meditation", "Discourses", "Hindi Audio Discourses", "English Audio Discourses", "Hindi E-Books", "English E-Books", "Search Archive", "Video", "News & Media", "News", "Osho Art News", "Shop", "Pearls", "Music", "Magazine", "Tarot", "FAQ", "Login", "Share", "Whatsapp", "Facebook", "Instagram", "X", "Gmail", "Pinterest", "Copied !", "Language :", "Download", "UP NEXT", "Previous", "Next", "Related", "Menu", "Search", "0", "/", "#", "english", "hindi", "Description", "ZEN AND ZEN MASTERS", "Zen and Zen Masters", "View All", "Click Here", "Read More", "Explore More", "Full Story", "osho pearls", "Store", "Oshodham Programs", "Upcoming Programs", "Audio Discourse", "Osho Magazine", "Books", "Play Audio", "Contact Us", "Osho Dham, Osho Dhyan Mandir, 44, Jhatikra Road, Pandwala Khurd,", "Near Najafgarh, New Delhi - 110043", "+91-9971992227, 9717490340", "contact@oshoworld.com", "How to reach Oshodham", "Who is Osho", "Biography", "Osho On Mystic", "Other Centres", "Documentaries", "Call of the Master", "Hindi Audio Discourse", "English Audio Discourse", "Search Book Archive", "Meditation Books", "About Oshodham", "Getting Here", "Upcoming Event", "Osho Active Meditations", "Osho Passive Meditations", "Osho Whiterobe", "Osho Mystic Rose", "Osho No-mind", "Osho Born Again", "Osho Vipassana", "Osho Zazen", "Children Meditation Camp", "Vigyan Bhairav Tantra", "Audios", "Videos", "Osho Books", "Audio", "Osho Photos", "Magazine Subscription", "Osho Arts", "Osho Gifts", "others", "Osho Centres", "Privacy Policy", "Cookie policy", "Terms and Conditions", "Shipping & Delivery Policy", "Return Policy", "Cancellation Policy", "Follow Us :"
+}
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -46,9 +79,9 @@ WORKER_DRIVER = None  # Global driver for connection pooling
 def load_progress():
     """Load the progress file (handles both old list format and new dict format)"""
     if Path(PROGRESS_FILE).exists():
-        with open(PROGRESS_FILE, "r", encoding="utf-8") as f:
+        with open(PROGRESS_FILE, "rb") as f:
             try:
-                data = json.load(f)
+                data = orjson.loads(f.read())
                 # Handle new robust format
                 if isinstance(data, dict) and "completed_discourses" in data:
                     return data
@@ -59,15 +92,16 @@ def load_progress():
                 # Handle raw list (very old version)
                 elif isinstance(data, list):
                     return {"completed_discourses": data, "chapter_logs": []}
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
     return {"completed_discourses": [], "chapter_logs": []}
 
 
 def save_progress(progress_data):
-    """Save the comprehensive progress data to JSON"""
-    with open(PROGRESS_FILE, "w", encoding="utf-8") as f:
-        json.dump(progress_data, f, indent=2, ensure_ascii=False)
+    """Save the comprehensive progress data to JSON (via a temp file, so a crash can't truncate it)"""
+    tmp_path = Path(PROGRESS_FILE + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(progress_data, option=orjson.OPT_INDENT_2))
+    tmp_path.replace(PROGRESS_FILE)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -76,21 +110,15 @@ def save_progress(progress_data):
 
 def make_driver(chromedriver_path):
     pid = os.getpid()
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-dev-shm-usage")
+    options = chrome_options(window_size='800,600', images=ENABLE_IMAGES)
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
-    options.add_argument("--disable-extensions")
     options.add_argument("--disable-plugins")
     options.add_argument("--disable-web-security")
     options.add_argument("--no-default-browser-check")
     options.add_argument("--disable-sync")
     options.add_argument("--mute-audio")
-    options.add_argument("--window-size=800,600")
     
     prefs = {
         "profile.managed_default_content_settings.images": 2 if not ENABLE_IMAGES else 1,
@@ -103,6 +131,9 @@ def make_driver(chromedriver_path):
     try:
         service = Service(chromedriver_path)
         driver = webdriver.Chrome(service=service, options=options)
+        # Fonts, media and trackers are never read; the content-setting prefs
+        # above only cover images and stylesheets
+        block_heavy_resources(driver)
         driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
         driver.set_script_timeout(SCRIPT_TIMEOUT)
         return driver
@@ -126,14 +157,19 @@ def close_worker_driver():
         finally:
             WORKER_DRIVER = None
 
+def get_worker_client():
+    global WORKER_CLIENT
+    if WORKER_CLIENT is None:
+        WORKER_CLIENT = httpx.Client(http2=True, headers=HEADERS, timeout=PAGE_LOAD_TIMEOUT, follow_redirects=True)
+    return WORKER_CLIENT
+
+def document_complete(driver):
+    return driver.execute_script('return document.readyState') == 'complete'
+
 def accept_cookies(driver):
     try:
-        accept_button = WebDriverWait(driver, WAIT_COOKIE_POPUP).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]" ))
-        )
-        accept_button.click()
-        time.sleep(0.3)
-    except Exception:
+        driver.execute_script(ACCEPT_COOKIES_JS)
+    except WebDriverException:
         pass
 
 
@@ -141,70 +177,71 @@ def accept_cookies(driver):
 # SCRAPING LOGIC
 # ═══════════════════════════════════════════════════════════════════════
 
-def extract_chapter(driver, url: str, discourse_name: str = "") -> Dict:
+def load_page(driver, url: str) -> str:
     for attempt in range(MAX_RETRIES):
         try:
             driver.get(url)
             if WAIT_DOCUMENT_READY > 0:
-                WebDriverWait(driver, WAIT_DOCUMENT_READY).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+                WebDriverWait(driver, WAIT_DOCUMENT_READY).until(document_complete)
             else:
-                WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                WebDriverWait(driver, 3).until(BODY_PRESENT)
             accept_cookies(driver)
             if WAIT_CONTENT_ELEMENT > 0:
-                WebDriverWait(driver, WAIT_CONTENT_ELEMENT).until(EC.presence_of_element_located((By.ID, "content")))
-            html = driver.page_source
-            break
+                WebDriverWait(driver, WAIT_CONTENT_ELEMENT).until(CONTENT_PRESENT)
+            return page_html(driver)
         except (TimeoutException, WebDriverException) as e:
             if attempt == MAX_RETRIES - 1:
                 raise
             time.sleep(WAIT_RETRY_DELAY)
 
-    # 1. Title
-    title = ''
-    try:
-        for sel in ('h1.entry-title', 'h1.post-title', 'h1.page-title', 'h1'):
-            try:
-                el = driver.find_element(By.CSS_SELECTOR, sel)
-                txt = el.text.strip()
-                if txt:
-                    title = txt
-                    break
-            except Exception: continue
-    except Exception: pass
-    if not title: title = (driver.title or '').strip()
-
-    # 2. Metadata (MP3, Images, Duration, Tags)
-    mp3_links = []
+def fetch_static_page(url: str):
+    """Raw HTML of the chapter over plain HTTP, or None if the request failed"""
     try:
-        for a in driver.find_elements(By.CSS_SELECTOR, 'a[href$=".mp3"]'):
-            if a.get_attribute('href'): mp3_links.append(a.get_attribute('href'))
-        for s in driver.find_elements(By.CSS_SELECTOR, 'audio source[src]'):
-            if s.get_attribute('src') and s.get_attribute('src').endswith('.mp3'): mp3_links.append(s.get_attribute('src'))
-    except Exception: pass
-
-    image_url = ''
-    try:
-        image_url = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]').get_attribute('content')
-    except Exception: pass
-
+        response = get_worker_client().get(url)
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return None
+    return response.text
+
+def extract_chapter(get_driver, url: str, discourse_name: str = "") -> Dict:
+    # Cached page, else plain HTTP; Chrome is only started when the raw HTML
+    # doesn't give both an MP3 link and a transcript
+    html = cached_html(url)
+    if html is not None:
+        return parse_chapter(html, url, discourse_name)
+
+    html = fetch_static_page(url)
+    chapter = parse_chapter(html, url, discourse_name) if html is not None else None
+    if not chapter or not (chapter['mp3_links'] and chapter['transcript']):
+        html = load_page(get_driver(), url)
+        chapter = parse_chapter(html, url, discourse_name)
+
+    # Cache only real chapter pages, so a wrong URL is retried (and its variants tried) next run
+    if chapter['transcript']:
+        store_html(url, html)
+    return chapter
+
+def parse_chapter(html: str, url: str, discourse_name: str = "") -> Dict:
+    soup = BeautifulSoup(html, 'lxml')
+
+    # 1. Title, MP3 links and image
+    page_data = chapter_data_from_soup(soup, url)
+    title = page_data['title']
+    mp3_links = page_data['mp3_links']
+    image_url = page_data['image_url']
+
+    # 2. Metadata (Duration, Tags)
     duration = ''
-    m = re.search(r'\b\d{1,2}:\d{2}:\d{2}\b', html)
+    m = DURATION_PAT.search(html)
     if m: duration = m.group(0)
 
     tags = []
-    try:
-        for t in driver.find_elements(By.CSS_SELECTOR, 'a[href*="/tag/"], a[href*="/category/"], a[rel="tag"]'):
-            txt = t.get_attribute("textContent").strip()
-            if txt and len(txt) < 50 and txt not in tags: tags.append(txt)
-    except Exception: pass
+    for t in soup.select('a[href*="/tag/"], a[href*="/category/"], a[rel="tag"]'):
+        txt = t.get_text().strip()
+        if txt and len(txt) < 50 and txt not in tags: tags.append(txt)
 
     # 3. Transcript
     transcript_lines = []
-    soup = BeautifulSoup(html, 'html.parser')
-
-    BANNED_PHRASES = {
-        "Home", "OSHO", "About Osho", "Osho Biography", "Osho on Mystic", "Osho Photo Gallery", "Osho Dham", "Upcoming Events", "Meditation Programs", "Meditation", "Active Meditation", "Passive Meditation", "Discourses", "Hindi Audio Discourses", "English Audio Discourses", "Hindi E-Books", "English E-Books", "Search Archive", "Video", "News & Media", "News", "Osho Art News", "Shop", "Pearls", "Music", "Magazine", "Tarot", "FAQ", "Login", "Share", "Whatsapp", "Facebook", "Instagram", "X", "Gmail", "Pinterest", "Copied !", "Language :", "Download", "UP NEXT", "Previous", "Next", "Related", "Menu", "Search", "0", "/", "#", "english", "hindi", "Description", "ZEN AND ZEN MASTERS", "Zen and Zen Masters", "View All", "Click Here", "Read More", "Explore More", "Full Story", "osho pearls", "Store", "Oshodham Programs", "Upcoming Programs", "Audio Discourse", "Osho Magazine", "Books", "Play Audio", "Contact Us", "Osho Dham, Osho Dhyan Mandir, 44, Jhatikra Road, Pandwala Khurd,", "Near Najafgarh, New Delhi - 110043", "+91-9971992227, 9717490340", "contact@oshoworld.com", "How to reach Oshodham", "Who is Osho", "Biography", "Osho On Mystic", "Other Centres", "Documentaries", "Call of the Master", "Hindi Audio Discourse", "English Audio Discourse", "Search Book Archive", "Meditation Books", "About Oshodham", "Getting Here", "Upcoming Event", "Osho Active Meditations", "Osho Passive Meditations", "Osho Whiterobe", "Osho Mystic Rose", "Osho No-mind", "Osho Born Again", "Osho Vipassana", "Osho Zazen", "Children Meditation Camp", "Vigyan Bhairav Tantra", "Audios", "Videos", "Osho Books", "Audio", "Osho Photos", "Magazine Subscription", "Osho Arts", "Osho Gifts", "others", "Osho Centres", "Privacy Policy", "Cookie policy", "Terms and Conditions", "Shipping & Delivery Policy", "Return Policy", "Cancellation Policy", "Follow Us :"
-    }
 
     content_element = None
     for selector in ['.entry-content', '.post-content', '.td-post-content', '.tdb-block-inner', 'article', '.main-content', '#content', '#main']:
@@ -236,11 +273,11 @@ def extract_chapter(driver, url: str, discourse_name: str = "") -> Dict:
             # Fuzzy Logic for Playlist items
             if discourse_name and len(clean_line) < 100:
                 similarity = difflib.SequenceMatcher(None, clean_line.lower(), discourse_name.lower()).ratio()
-                if similarity > 0.6 and re.search(r'\d+$', clean_line): continue
+                if similarity > 0.6 and TRAILING_NUMBER_PAT.search(clean_line): continue
                 if similarity > 0.9: continue
 
-            if re.match(r'^\d{2}:\d{2}:\d{2}$', clean_line) or re.match(r'^\d{2}:\d{2}$', clean_line): continue
-            if re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(st|nd|rd|th)?,?\s+\d{4}', clean_line, re.IGNORECASE): continue
+            if TIMESTAMP_LINE_PAT.match(clean_line): continue
+            if DATE_PAT.search(clean_line): continue
             if "Copyright" in clean_line and "Osho" in clean_line: continue
             if len(clean_line) < 50 and clean_line.isupper() and not clean_line.endswith(('.', '?', '!')): continue
 
@@ -255,7 +292,7 @@ def extract_chapter(driver, url: str, discourse_name: str = "") -> Dict:
     return {
         'title': title,
         'url': url,
-        'mp3_links': list(dict.fromkeys(mp3_links)),
+        'mp3_links': mp3_links,
         'image_url': image_url,
         'duration': duration,
         'tags': tags,
@@ -265,8 +302,8 @@ def extract_chapter(driver, url: str, discourse_name: str = "") -> Dict:
 
 def generate_url_variants(url):
     variants = []
-    if re.search(r'vol-0\d', url): variants.append(re.sub(r'vol-0(\d)', r'vol-\1', url))
-    elif re.search(r'vol-\d-', url) or re.search(r'vol-\d$', url): variants.append(re.sub(r'vol-(\d)', r'vol-0\1', url))
+    if VOL_PADDED_PAT.search(url): variants.append(VOL_PADDED_PAT.sub(r'vol-\1', url))
+    elif VOL_SINGLE_DIGIT_PAT.search(url): variants.append(VOL_DIGIT_PAT.sub(r'vol-0\1', url))
     return variants
 
 
@@ -283,10 +320,10 @@ def process_chapter(chapter_task):
     print(f"[PID {pid}] 🚀 Starting chapter {chapter_id}")
 
     try:
-        driver = get_worker_driver(chromedriver_path)
+        get_driver = partial(get_worker_driver, chromedriver_path)
         
         # 1. Scrape
-        chapter_details = extract_chapter(driver, chapter_url, discourse_name)
+        chapter_details = extract_chapter(get_driver, chapter_url, discourse_name)
         
         # 2. Retry Logic
         if chapter_details['title'].strip().lower() == "osho world" or not chapter_details['transcript']:
@@ -294,7 +331,7 @@ def process_chapter(chapter_task):
             variants = generate_url_variants(chapter_url)
             for variant_url in variants:
                 print(f"[PID {pid}] 🔄 Retrying with: {variant_url}")
-                retry_details = extract_chapter(driver, variant_url, discourse_name)
+                retry_details = extract_chapter(get_driver, variant_url, discourse_name)
                 if retry_details['title'].strip().lower() != "osho world" and retry_details['transcript']:
                     print(f"[PID {pid}] ✅ Variant worked!")
                     chapter_details = retry_details
@@ -355,12 +392,13 @@ def save_discourse_data(discourse_index, discourse, chapters_data):
         }
     }
 
-    safe_filename = re.sub(r'[\\/*?:":<>|]', "", discourse["discourse_name"])
+    safe_filename = UNSAFE_FILENAME_PAT.sub("", discourse["discourse_name"])
     out_dir = Path("output")
     out_dir.mkdir(parents=True, exist_ok=True)
     output_file = out_dir / f"{safe_filename}.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(discourse_data, f, ensure_ascii=False, indent=2)
+    tmp_path = output_file.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(discourse_data, option=orjson.OPT_INDENT_2))
+    tmp_path.replace(output_file)
 
     print(f"\n✅ Saved discourse {discourse_id} | Coverage: {chapters_with_transcript}/{len(chapters_data)}")
     return discourse["discourse_url"]
@@ -375,15 +413,15 @@ def main(count, workers):
     
     print("Initializing ChromeDriver...")
     try:
-        chromedriver_path = ChromeDriverManager().install()
-        print(f"✅ ChromeDriver ready at: {chromedriver_path}\n")
+        chromedriver_path = driver_path()
+        print(f"✅ ChromeDriver ready at: {chromedriver_path or 'Selenium Manager'}\n")
     except Exception as e:
         print(f"❌ Failed to initialize ChromeDriver: {e}")
         return
     
     try:
-        with open("chapter_links.json", "r", encoding="utf-8") as f:
-            all_discourses = json.load(f)
+        with open("chapter_links.json", "rb") as f:
+            all_discourses = orjson.loads(f.read())
     except FileNotFoundError:
         print("❌ Error: chapter_links.json not found.")
         return